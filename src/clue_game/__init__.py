@@ -3,13 +3,14 @@ Clue Board Game with LLM Agents
 A multi-agent CrewAI implementation of the classic Clue/Cluedo board game.
 """
 
-from clue_game.game_state import GameState, get_game_state, reset_game_state
+from clue_game.game_state import GameState, get_game_state, reset_game_state, new_game
 from clue_game.crew import ClueGameCrew
 
 __all__ = [
     "GameState",
     "get_game_state",
     "reset_game_state",
+    "new_game",
     "ClueGameCrew",
 ]
 
@@ -18,9 +18,13 @@ Key rules implemented:
 """
 
 import random
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Optional, Tuple, List, Set
+from typing import Optional, Tuple, List, Set, FrozenSet, Dict
 from enum import Enum
+from functools import lru_cache
+
+from clue_game.notebook import get_notebook, reset_all_notebooks
 
 
 class Suspect(Enum):
@@ -189,6 +193,12 @@ DOOR_POSITIONS = {
     (23, 16): Room.STUDY,
 }
 
+# Door positions grouped by room (built once; the board never changes)
+ROOM_DOOR_POSITIONS = {
+    room: tuple(pos for pos, r in DOOR_POSITIONS.items() if r == room)
+    for room in Room
+}
+
 # Starting positions (grid coordinates)
 # Format: Suspect: (row, col)
 STARTING_GRID_POSITIONS = {
@@ -259,6 +269,88 @@ def get_adjacent_cells(row: int, col: int) -> List[Tuple[int, int]]:
         (row, col - 1),  # Left
         (row, col + 1),  # Right
     ]
+
+
+@lru_cache(maxsize=32)
+def _reachable_doors(
+    start: Tuple[int, int], moves: int, blocked: frozenset
+) -> Tuple[Tuple[Room, int, Tuple[Tuple[int, int], ...]], ...]:
+    """
+    BFS from start to every room door within the given number of moves.
+    
+    The board layout is fixed, so the result depends only on the arguments;
+    repeated queries with the same position, moves and blocked squares
+    (e.g. several tool calls in one turn) are served from the cache.
+    
+    Args:
+        start: Grid position to search from
+        moves: Maximum number of steps
+        blocked: Squares that cannot be entered (occupied or already visited)
+    
+    Returns:
+        Tuple of (Room, distance, path) entries in BFS order
+    """
+    queue = deque([(start, 0, (start,))])  # (position, distance, path)
+    visited = {start}
+    reachable_rooms = []
+    
+    while queue:
+        pos, dist, path = queue.popleft()
+        
+        if dist >= moves:
+            continue
+        
+        for adj_row, adj_col in get_adjacent_cells(pos[0], pos[1]):
+            next_pos = (adj_row, adj_col)
+            
+            if next_pos in visited or next_pos in blocked:
+                continue
+            
+            cell_type, room = get_cell_type(adj_row, adj_col)
+            
+            if cell_type == CellType.DOOR:
+                # Found a room door
+                reachable_rooms.append((room, dist + 1, path + (next_pos,)))
+                visited.add(next_pos)
+            elif cell_type in (CellType.HALLWAY, CellType.START):
+                visited.add(next_pos)
+                queue.append((next_pos, dist + 1, path + (next_pos,)))
+    
+    return tuple(reachable_rooms)
+
+
+@lru_cache(maxsize=None)
+def _room_distances_from(room: Room) -> Dict[Room, int]:
+    """
+    Fewest hallway steps from any door of a room to a door of each other room.
+    
+    Other players and squares visited this turn are ignored, so the result is
+    a lower bound on the distance get_reachable_rooms can find after leaving
+    through one of the room's doors. Same BFS rules as _reachable_doors.
+    
+    Returns:
+        Dict of Room -> steps for every other room reachable on foot
+    """
+    doors = ROOM_DOOR_POSITIONS[room]
+    queue = deque((door, 0) for door in doors)
+    visited = set(doors)
+    distances: Dict[Room, int] = {}
+    
+    while queue:
+        pos, dist = queue.popleft()
+        for next_pos in get_adjacent_cells(pos[0], pos[1]):
+            if next_pos in visited:
+                continue
+            cell_type, other = get_cell_type(next_pos[0], next_pos[1])
+            if cell_type == CellType.DOOR:
+                visited.add(next_pos)
+                if other is not room:
+                    distances.setdefault(other, dist + 1)
+            elif cell_type in (CellType.HALLWAY, CellType.START):
+                visited.add(next_pos)
+                queue.append((next_pos, dist + 1))
+    
+    return distances
 # Each room has specific doors that connect to hallways
 # Format: { Room: [(door_side, connects_to_hallway_toward), ...] }
 ROOM_DOORS = {
@@ -388,11 +480,15 @@ class Player:
     successful_suggestions: int = 0  # Count of logical suggestions made
     wasted_suggestions: int = 0  # Count of suggestions on known cards
     
+    # Display name of this character's START square (set from character)
+    start_name: str = field(init=False, repr=False, default="START")
+    
     def __post_init__(self):
+        self.start_name = STARTING_POSITION_NAMES.get(self.character, "START")
         # Initialize knowledge tracking
         self.knowledge = {
             "my_cards": [],
-            "seen_cards": [],  # Cards shown to this player
+            "seen_cards": set(),  # Cards shown to this player
             "suggestions_made": [],
             "suggestions_witnessed": [],
             "eliminated_suspects": [],
@@ -569,13 +665,12 @@ class GameState:
         if player.position:
             player.visited_this_turn.add(player.position)
     
-    def get_occupied_positions(self, exclude_player: Optional[Player] = None) -> Set[Tuple[int, int]]:
+    def get_occupied_positions(self, exclude_player: Optional[Player] = None) -> FrozenSet[Tuple[int, int]]:
         """Get all grid positions currently occupied by players in hallways."""
-        occupied = set()
-        for p in self.players:
-            if p.position and p.in_hallway and p != exclude_player:
-                occupied.add(p.position)
-        return occupied
+        return frozenset(
+            p.position for p in self.players
+            if p.position and p.in_hallway and p is not exclude_player
+        )
     
     def can_move_to_cell(self, player: Player, row: int, col: int, 
                           occupied: Set[Tuple[int, int]]) -> Tuple[bool, Optional[Room]]:
@@ -611,17 +706,23 @@ class GameState:
         
         return (False, None)
     
-    def get_valid_moves_from_position(self, player: Player) -> List[Tuple[int, int, Optional[Room]]]:
+    def get_valid_moves_from_position(self, player: Player,
+                                      occupied: Optional[Set[Tuple[int, int]]] = None) -> List[Tuple[int, int, Optional[Room]]]:
         """
         Get all valid moves from player's current position.
         
+        Args:
+            player: The player to move
+            occupied: Squares held by other players, if the caller already has them
+        
         Returns list of (row, col, room_if_door) tuples.
         Room is None for hallway moves, or the Room if stepping on a door.
         """
         if not player.position or player.moves_remaining <= 0:
             return []
         
-        occupied = self.get_occupied_positions(exclude_player=player)
+        if occupied is None:
+            occupied = self.get_occupied_positions(exclude_player=player)
         valid_moves = []
         
         for adj_row, adj_col in get_adjacent_cells(player.position[0], player.position[1]):
@@ -682,58 +783,79 @@ class GameState:
         
         return (True, None, f"Moved to ({row}, {col}). {player.moves_remaining} moves remaining.")
     
-    def get_reachable_rooms(self, player: Player) -> List[Tuple[Room, int, List[Tuple[int, int]]]]:
+    def execute_validated_path(self, player: Player, path: List[Tuple[int, int]]) -> Tuple[bool, Optional[Room], str]:
+        """
+        Move a player along a whole path in one update.
+        
+        The path must come from get_reachable_rooms for the player's current
+        state, which has already checked adjacency, occupancy and repeat
+        squares, so the steps are not re-validated one by one.
+        
+        Returns:
+            (success, room_entered, message) - same shape as move_player_one_step
+        """
+        if not player.position or not path or path[0] != player.position:
+            return (False, None, "Path does not start at the player's position")
+        
+        steps = path[1:]
+        if len(steps) > player.moves_remaining:
+            return (False, None, "Not enough moves remaining for this path")
+        if not steps:
+            return (True, None, f"Stayed at {player.position}. {player.moves_remaining} moves remaining.")
+        
+        player.visited_this_turn.update(steps)
+        player.moves_remaining -= len(steps)
+        row, col = steps[-1]
+        player.position = (row, col)
+        
+        cell_type, room = get_cell_type(row, col)
+        if cell_type == CellType.DOOR:
+            # Entered a room through door - movement ends
+            player.current_room = room
+            player.in_hallway = False
+            player.position = None  # Clear grid position
+            player.moves_remaining = 0  # Movement ends
+            player.has_moved_since_suggestion = True
+            player.was_moved_by_suggestion = False
+            player.entered_room_this_turn = True  # Mark that player entered a room this turn
+            return (True, room, f"Entered {room.value}! Movement ends.")
+        
+        return (True, None, f"Moved to ({row}, {col}). {player.moves_remaining} moves remaining.")
+    
+    def get_reachable_rooms(self, player: Player,
+                            occupied: Optional[Set[Tuple[int, int]]] = None) -> List[Tuple[Room, int, List[Tuple[int, int]]]]:
         """
         Find all rooms reachable with the player's remaining moves.
         Uses BFS to find shortest paths to room doors.
         
+        Args:
+            player: The player to move
+            occupied: Squares held by other players, if the caller already has them
+        
         Returns:
             List of (Room, distance, path) tuples for reachable rooms
         """
         if not player.position or player.moves_remaining <= 0:
             return []
         
-        from collections import deque
-        
-        occupied = self.get_occupied_positions(exclude_player=player)
-        start = player.position
-        
-        # BFS to find all reachable doors
-        queue = deque([(start, 0, [start])])  # (position, distance, path)
-        visited = {start}
-        reachable_rooms = []
+        if occupied is None:
+            occupied = self.get_occupied_positions(exclude_player=player)
+        blocked = frozenset(occupied).union(player.visited_this_turn)
         
-        while queue:
-            pos, dist, path = queue.popleft()
-            
-            if dist >= player.moves_remaining:
-                continue
-            
-            for adj_row, adj_col in get_adjacent_cells(pos[0], pos[1]):
-                next_pos = (adj_row, adj_col)
-                
-                if next_pos in visited or next_pos in player.visited_this_turn:
-                    continue
-                if next_pos in occupied:
-                    continue
-                
-                cell_type, room = get_cell_type(adj_row, adj_col)
-                
-                if cell_type == CellType.DOOR:
-                    # Found a room door
-                    new_path = path + [next_pos]
-                    reachable_rooms.append((room, dist + 1, new_path))
-                    visited.add(next_pos)
-                elif cell_type in (CellType.HALLWAY, CellType.START):
-                    visited.add(next_pos)
-                    queue.append((next_pos, dist + 1, path + [next_pos]))
-        
-        return reachable_rooms
-    
-    def exit_room_to_hallway(self, player: Player, door_position: Tuple[int, int]) -> bool:
+        return [
+            (room, distance, list(path))
+            for room, distance, path in _reachable_doors(
+                player.position, player.moves_remaining, blocked
+            )
+        ]
+    
+    def exit_room_to_hallway(self, player: Player, door_position: Tuple[int, int],
+                             occupied: Optional[Set[Tuple[int, int]]] = None) -> bool:
         """
         Move a player from a room to a hallway through a specific door.
         This uses 1 move and places the player at the door position.
+        
+        Other players' squares are looked up unless passed in as occupied.
         """
         if not player.current_room:
             return False
@@ -744,7 +866,8 @@ class GameState:
             return False
         
         # Check if door is blocked
-        occupied = self.get_occupied_positions(exclude_player=player)
+        if occupied is None:
+            occupied = self.get_occupied_positions(exclude_player=player)
         if door_position in occupied:
             return False
         
@@ -760,13 +883,17 @@ class GameState:
         
         return True
     
-    def get_room_doors(self, room: Room) -> List[Tuple[int, int]]:
+    def min_steps_between_rooms(self, from_room: Room, to_room: Room) -> Optional[int]:
+        """
+        Lower bound on the hallway steps from leaving from_room to entering
+        to_room, not counting the step out through the door. None if no
+        hallway route exists. Not meaningful for from_room == to_room.
+        """
+        return _room_distances_from(from_room).get(to_room)
+    
+    def get_room_doors(self, room: Room) -> Tuple[Tuple[int, int], ...]:
         """Get all door positions for a room."""
-        doors = []
-        for pos, r in DOOR_POSITIONS.items():
-            if r == room:
-                doors.append(pos)
-        return doors
+        return ROOM_DOOR_POSITIONS[room]
     
     def use_secret_passage(self, player: Player) -> Tuple[bool, str]:
         """
@@ -809,13 +936,14 @@ class GameState:
         magnifying_count = (1 if die1 == 1 else 0) + (1 if die2 == 1 else 0)
         return die1, die2, magnifying_count
     
-    def get_random_clue(self, player: Player) -> Optional[Tuple[str, Optional[str]]]:
+    def get_random_clue(self, player: Player) -> Optional[Tuple[str, Optional[str], str]]:
         """
         Get a random clue for the magnifying glass ability.
         
-        Returns a tuple of (clue_text, holder_name) where:
+        Returns a tuple of (clue_text, holder_name, card_name) where:
         - clue_text: A hint about a card that is NOT in the solution
         - holder_name: The name of the player who holds this card (or None if in solution)
+        - card_name: The card the clue is about
         
         This helps the player narrow down possibilities.
         """
@@ -851,7 +979,7 @@ class GameState:
         card_type, card_name = random.choice(all_cards)
         holder_name = card_holders.get(card_name)
         clue_text = f"{card_name} is NOT the murder {card_type}"
-        return (clue_text, holder_name)
+        return (clue_text, holder_name, card_name)
     
     def move_suspect_to_room(self, suspect_name: str, room: Room) -> Optional[Player]:
         """
@@ -974,25 +1102,34 @@ class GameState:
                 return player
         return None
     
+    def get_player_by_character(self, character: Suspect) -> Optional[Player]:
+        """Get the player playing a given suspect, if anyone is."""
+        for player in self.players:
+            if player.character is character:
+                return player
+        return None
+    
     def get_game_summary(self) -> str:
         """Get a summary of the current game state."""
-        summary = f"=== Turn {self.turn_number} ===\n"
-        summary += f"Current Player: {self.get_current_player().name}\n\n"
+        parts = [
+            f"=== Turn {self.turn_number} ===\n",
+            f"Current Player: {self.get_current_player().name}\n\n",
+        ]
         
         for player in self.players:
             status = "Active" if player.is_active else "Eliminated"
             room = player.current_room.value if player.current_room else "Not in a room"
-            summary += f"{player.name} ({player.character.value}): {status}, Location: {room}\n"
+            parts.append(f"{player.name} ({player.character.value}): {status}, Location: {room}\n")
         
         if self.suggestion_history:
-            summary += f"\nLast suggestion: {self.suggestion_history[-1].suggester} suggested "
             last = self.suggestion_history[-1]
-            summary += f"{last.suspect} with {last.weapon} in {last.room}"
+            parts.append(f"\nLast suggestion: {last.suggester} suggested "
+                         f"{last.suspect} with {last.weapon} in {last.room}")
             if last.disproven_by:
-                summary += f" (disproven by {last.disproven_by})"
-            summary += "\n"
+                parts.append(f" (disproven by {last.disproven_by})")
+            parts.append("\n")
         
-        return summary
+        return "".join(parts)
 
 
 # Global game state instance
@@ -1012,3 +1149,26 @@ def reset_game_state() -> GameState:
     global _game_state
     _game_state = GameState()
     return _game_state
+
+
+def new_game(player_names: list[str]) -> GameState:
+    """
+    Start a fresh game in one step.
+    
+    Resets the global game state, deals the cards, and gives every player
+    a blank detective notebook (columns in turn order).
+    
+    Args:
+        player_names: Names of the players taking part
+    
+    Returns:
+        The newly set-up global game state
+    """
+    reset_all_notebooks()
+    game_state = reset_game_state()
+    game_state.setup_game(player_names)
+    
+    turn_order = [p.name for p in game_state.players]
+    for name in turn_order:
+        get_notebook(name, turn_order)
+    return game_state
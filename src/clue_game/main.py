@@ -16,8 +16,7 @@ os.environ["CREWAI_TRACING_ENABLED"] = "false"
 
 from dotenv import load_dotenv
 
-from clue_game.game_state import get_game_state, reset_game_state, STARTING_POSITION_NAMES
-from clue_game.notebook import reset_all_notebooks
+from clue_game.game_state import get_game_state, new_game, STARTING_POSITION_NAMES
 from clue_game.crew import (
     ClueGameCrew,
     create_player_turn_crew,
@@ -234,14 +233,19 @@ def get_error_details(exception):
     return " | ".join(error_info)
 
 
-def retry_with_backoff(func, max_retries=3, base_delay=5):
+def retry_with_backoff(func, max_retries=3, base_delay=5, max_delay=60):
     """
-    Retry a function with exponential backoff.
+    Retry a function with jittered exponential backoff.
+    
+    Each delay is drawn uniformly between base_delay and
+    base_delay * 3 * 2**attempt (capped at max_delay), so callers that
+    fail together (e.g. on a shared 429) don't all retry at the same instant.
     
     Args:
         func: Callable to retry
         max_retries: Maximum number of retry attempts
         base_delay: Base delay in seconds (will be multiplied exponentially)
+        max_delay: Upper bound on any single delay in seconds
     
     Returns:
         The result of the function call
@@ -275,14 +279,15 @@ def retry_with_backoff(func, max_retries=3, base_delay=5):
                 logger.error(f"Attempt {attempt + 1} failed with exception:", exc_info=True)
             
             if attempt < max_retries:
-                delay = base_delay * (2 ** attempt)  # Exponential backoff: 5, 10, 20 seconds
+                # Jittered exponential backoff: 5-15, 5-30, 5-60 seconds
+                delay = random.uniform(base_delay, min(max_delay, base_delay * 3 * (2 ** attempt)))
                 sys.stdout.write(f"\n⚠️ Attempt {attempt + 1}/{max_retries + 1} failed\n")
                 sys.stdout.write(f"   📋 Error: {error_details}\n")
                 if debug_mode:
                     sys.stdout.write(f"   🔍 Stack trace:\n")
                     for line in traceback.format_exception(type(e), e, e.__traceback__):
                         sys.stdout.write(f"      {line}")
-                sys.stdout.write(f"🔄 Retrying in {delay} seconds...\n")
+                sys.stdout.write(f"🔄 Retrying in {delay:.1f} seconds...\n")
                 sys.stdout.flush()
                 time.sleep(delay)
             else:
@@ -324,16 +329,13 @@ def run_game(num_players: int = 6, max_turns: int = 50):
     print("🔍 CLUE: THE MYSTERY GAME WITH AI AGENTS 🔍")
     print("=" * 60 + "\n")
     
-    # Initialize game state and reset all notebooks
-    game_state = reset_game_state()
-    reset_all_notebooks()  # Reset deterministic notebooks for new game
-    
-    # Select the first N players
+    # Select the first N players and start a fresh game (state + notebooks)
     player_names = [p["name"] for p in PLAYER_CONFIGS[:num_players]]
-    game_state.setup_game(player_names)
+    game_state = new_game(player_names)
     
-    # Track which players have had their first turn (for notebook init)
-    players_first_turn = {name: True for name in player_names}
+    # Track which players have had their first turn (for notebook init).
+    # One bit per seat, indexed by position in game_state.players.
+    first_turn_mask = (1 << num_players) - 1
     
     # Create the crew instance
     clue_crew = ClueGameCrew()
@@ -350,6 +352,8 @@ def run_game(num_players: int = 6, max_turns: int = 50):
     }
     # Only instantiate agents for players in this game
     player_agents = {name: all_agents[name]() for name in player_names}
+    # Turn order is fixed after setup, so resolve each seat's agent once
+    seat_agents = tuple(player_agents[p.name] for p in game_state.players)
     
     # Announce game start
     print("\n📣 MODERATOR ANNOUNCEMENT:")
@@ -390,7 +394,8 @@ def run_game(num_players: int = 6, max_turns: int = 50):
     # Main game loop
     turn_count = 0
     while not game_state.game_over and turn_count < max_turns:
-        current_player = game_state.get_current_player()
+        seat = game_state.current_player_index
+        current_player = game_state.players[seat]
         
         if not current_player.is_active:
             game_state.next_turn()
@@ -398,16 +403,19 @@ def run_game(num_players: int = 6, max_turns: int = 50):
         
         turn_count += 1
         
-        sys.stdout.write("\n" + "=" * 50 + "\n")
-        sys.stdout.write(f"🎲 TURN {turn_count}: {current_player.name} ({current_player.character.value})\n")
-        sys.stdout.write("=" * 50 + "\n")
+        sys.stdout.write(
+            f"\n{'=' * 50}\n"
+            f"🎲 TURN {turn_count}: {current_player.name} ({current_player.character.value})\n"
+            f"{'=' * 50}\n"
+        )
         sys.stdout.flush()
         
         # Get the corresponding agent
-        player_agent = player_agents[current_player.name]
+        player_agent = seat_agents[seat]
         
         # Check if this is the player's first turn (needs notebook initialization)
-        is_first_turn = players_first_turn.get(current_player.name, False)
+        seat_bit = 1 << seat
+        is_first_turn = bool(first_turn_mask & seat_bit)
         
         # Create and run the player's turn crew
         turn_crew = create_player_turn_crew(
@@ -418,7 +426,7 @@ def run_game(num_players: int = 6, max_turns: int = 50):
         )
         
         # Mark that this player has had their first turn
-        players_first_turn[current_player.name] = False
+        first_turn_mask &= ~seat_bit
         
         try:
             result = retry_with_backoff(turn_crew.kickoff)
@@ -485,9 +493,8 @@ def run_single_turn_demo():
     print("=" * 60 + "\n")
     
     # Initialize game
-    game_state = reset_game_state()
     player_names = ["Scarlet", "Mustard", "Green", "Peacock"]
-    game_state.setup_game(player_names)
+    game_state = new_game(player_names)
     
     # Create crew and get first player's agent
     clue_crew = ClueGameCrew()
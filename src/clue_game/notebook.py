@@ -6,11 +6,35 @@ a hard-coded grid of card ownership. The LLM queries this tool instead
 of trying to remember card locations from conversation history.
 """
 
+import io
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
 
 
+# Fixed card layout: every notebook has the same 21 rows in this order.
+# Names are interned (below) so lookups and comparisons hit the pointer fast path.
+CARDS_BY_TYPE: dict[str, tuple[str, ...]] = {
+    "suspect": (
+        "Miss Scarlet", "Colonel Mustard", "Mrs. White",
+        "Mr. Green", "Mrs. Peacock", "Professor Plum",
+    ),
+    "weapon": (
+        "Candlestick", "Knife", "Lead Pipe",
+        "Revolver", "Rope", "Wrench",
+    ),
+    "room": (
+        "Kitchen", "Ballroom", "Conservatory", "Billiard Room",
+        "Library", "Study", "Hall", "Lounge", "Dining Room",
+    ),
+}
+CARDS_BY_TYPE = {
+    sys.intern(card_type): tuple(sys.intern(card) for card in cards)
+    for card_type, cards in CARDS_BY_TYPE.items()
+}
+
+
 class CardStatus(Enum):
     """Status of a card in relation to a player/envelope."""
     UNKNOWN = "?"      # Don't know if they have it
@@ -18,7 +42,26 @@ class CardStatus(Enum):
     NOT_HAS = "✗"      # Confirmed they don't have this card
 
 
-@dataclass
+# Module-level aliases so hot paths compare statuses by identity (`is`)
+_HAS, _NOT_HAS, _UNKNOWN = CardStatus.HAS, CardStatus.NOT_HAS, CardStatus.UNKNOWN
+
+# Owner recorded for cards known to be in the solution envelope
+ENVELOPE = "ENVELOPE"
+
+
+# Pre-centered grid cells for each status
+_STATUS_CELL = {status: status.value.center(10) for status in CardStatus}
+# Section headers for the grid, upper-cased once per card type
+_SECTION_HEADER = {card_type: f"\n--- {card_type.upper()}S ---\n" for card_type in CARDS_BY_TYPE}
+_GRID_LEGEND = "\nLegend: ✓=Has  ✗=Doesn't have  ?=Unknown\n"
+
+
+def _fresh_result(cached: dict) -> dict:
+    """Copy a memoized result dict (and its lists) so callers can't edit the cache."""
+    return {key: list(value) if isinstance(value, list) else value for key, value in cached.items()}
+
+
+@dataclass(slots=True)
 class NotebookEntry:
     """An entry tracking one card's status across all players."""
     card_name: str
@@ -26,21 +69,21 @@ class NotebookEntry:
     # Maps player name -> CardStatus
     player_status: dict[str, CardStatus] = field(default_factory=dict)
     envelope_status: CardStatus = CardStatus.UNKNOWN
+    # Player holding the card, "ENVELOPE", or None while unknown.
+    # Kept in sync by the notebook whenever a HAS is written or overridden.
+    owner: Optional[str] = None
     
     def is_solved(self) -> bool:
         """Returns True if we know where this card is."""
-        if self.envelope_status == CardStatus.HAS:
-            return True
-        return any(s == CardStatus.HAS for s in self.player_status.values())
+        return self.owner is not None
     
     def get_owner(self) -> Optional[str]:
         """Get who owns this card, if known."""
-        if self.envelope_status == CardStatus.HAS:
-            return "ENVELOPE"
-        for player, status in self.player_status.items():
-            if status == CardStatus.HAS:
-                return player
-        return None
+        return self.owner
+    
+    def held_by_player(self) -> bool:
+        """Returns True if a player (not the envelope) is known to hold this card."""
+        return self.owner is not None and self.owner != ENVELOPE
 
 
 class DetectiveNotebook:
@@ -56,53 +99,72 @@ class DetectiveNotebook:
     - Columns: Each player + "Envelope" (the solution)
     """
     
-    def __init__(self, owner_name: str, all_player_names: list[str]):
+    __slots__ = (
+        "verbose", "owner_name", "all_players", "entries", "suggestion_log", "turn_log",
+        "_entries_by_type", "_all_not_has", "_cache",
+        "_dirty_rows", "_grid_header", "_history_lines",
+    )
+    
+    def __init__(self, owner_name: str, all_player_names: list[str], verbose: bool = True):
         """
         Initialize notebook for a specific player.
         
         Args:
             owner_name: The player who owns this notebook
             all_player_names: List of all player names in the game
+            verbose: Record events in turn_log (the agents' event log).
+                Turn off for bulk/offline use where nobody reads the log.
         """
-        self.owner_name = owner_name
-        self.all_players = all_player_names
+        self.verbose = verbose
+        self.owner_name = sys.intern(owner_name)
+        self.all_players = [sys.intern(p) for p in all_player_names]
         self.entries: dict[str, NotebookEntry] = {}
+        # Same entries bucketed by card type, in CARDS_BY_TYPE order
+        self._entries_by_type: dict[str, list[NotebookEntry]] = {
+            card_type: [] for card_type in CARDS_BY_TYPE
+        }
         self.suggestion_log: list[dict] = []
         self.turn_log: list[str] = []  # Log of all events
+        # Formatted history text, one item per suggestion_log record
+        self._history_lines: list[str] = []
+        # Row template for "no player has this card", copied in with dict.update
+        self._all_not_has = dict.fromkeys(self.all_players, _NOT_HAS)
+        # Summary outputs memoized until the next deduction pass: key -> result
+        self._cache: dict[str | tuple, object] = {}
+        # Card rows written since the last deduction pass (ordered set)
+        self._dirty_rows: dict[str, None] = {}
+        
+        # Grid title and column header only depend on the player list
+        header = (
+            "Card".ljust(20)
+            + "".join(p[:8].center(10) for p in self.all_players)
+            + "ENVELOPE".center(10)
+        )
+        self._grid_header = (
+            "=== DETECTIVE NOTEBOOK GRID ===\n"
+            f"(Owner: {owner_name})\n\n"
+            f"{header}\n"
+            f"{'=' * len(header)}\n"
+        )
         
         # Initialize all cards
         self._init_cards()
     
     def _init_cards(self):
         """Initialize all card entries."""
-        suspects = [
-            "Miss Scarlet", "Colonel Mustard", "Mrs. White",
-            "Mr. Green", "Mrs. Peacock", "Professor Plum"
-        ]
-        weapons = [
-            "Candlestick", "Knife", "Lead Pipe",
-            "Revolver", "Rope", "Wrench"
-        ]
-        rooms = [
-            "Kitchen", "Ballroom", "Conservatory", "Billiard Room",
-            "Library", "Study", "Hall", "Lounge", "Dining Room"
-        ]
-        
-        for card in suspects:
-            self._add_card(card, "suspect")
-        for card in weapons:
-            self._add_card(card, "weapon")
-        for card in rooms:
-            self._add_card(card, "room")
+        for card_type, cards in CARDS_BY_TYPE.items():
+            for card in cards:
+                self._add_card(card, card_type)
     
     def _add_card(self, card_name: str, card_type: str):
         """Add a card entry to the notebook."""
         entry = NotebookEntry(
-            card_name=card_name,
-            card_type=card_type,
-            player_status={p: CardStatus.UNKNOWN for p in self.all_players}
+            card_name=sys.intern(card_name),
+            card_type=sys.intern(card_type),
+            player_status=dict.fromkeys(self.all_players, _UNKNOWN)
         )
-        self.entries[card_name] = entry
+        self.entries[entry.card_name] = entry
+        self._entries_by_type[entry.card_type].append(entry)
     
     def mark_card(self, card_name: str, player_name: str) -> str:
         """
@@ -116,33 +178,44 @@ class DetectiveNotebook:
         Returns:
             Confirmation message
         """
-        if card_name not in self.entries:
+        try:
+            entry = self.entries[card_name]
+        except KeyError:
             return f"Error: Unknown card '{card_name}'"
         
-        entry = self.entries[card_name]
-        
-        # Mark this player as having the card
-        if player_name in entry.player_status:
-            entry.player_status[player_name] = CardStatus.HAS
-        elif player_name.upper() == "ENVELOPE":
-            entry.envelope_status = CardStatus.HAS
-        else:
+        if not self._apply_has(entry, player_name):
             return f"Error: Unknown player '{player_name}'"
         
-        # Mark all OTHER players as NOT having this card
-        for other_player in self.all_players:
-            if other_player != player_name:
-                entry.player_status[other_player] = CardStatus.NOT_HAS
-        
-        # If a player has it, it's not in the envelope
-        if player_name != "ENVELOPE":
-            entry.envelope_status = CardStatus.NOT_HAS
-        
-        self._log(f"MARKED: {player_name} HAS '{card_name}'")
+        if self.verbose:
+            self._log(f"MARKED: {player_name} HAS '{card_name}'")
         self._check_deductions()
         
         return f"✓ Marked: {player_name} has '{card_name}'"
     
+    def _apply_has(self, entry: NotebookEntry, player_name: str) -> bool:
+        """
+        Write a HAS mark into an entry's row without running deductions.
+        
+        Returns:
+            False if player_name is neither a player nor the envelope
+        """
+        status = entry.player_status
+        if player_name in status:
+            # This player has it: everyone else and the envelope don't
+            status.update(self._all_not_has)
+            status[player_name] = _HAS
+            entry.envelope_status = _NOT_HAS
+            entry.owner = player_name
+        elif player_name.upper() == ENVELOPE:
+            # In the envelope: no player has it
+            status.update(self._all_not_has)
+            entry.envelope_status = _HAS
+            entry.owner = ENVELOPE
+        else:
+            return False
+        self._dirty_rows[entry.card_name] = None
+        return True
+    
     def mark_not_has(self, card_name: str, player_name: str) -> str:
         """
         Mark that a player does NOT have a specific card.
@@ -154,17 +227,22 @@ class DetectiveNotebook:
         Returns:
             Confirmation message
         """
-        if card_name not in self.entries:
+        try:
+            entry = self.entries[card_name]
+        except KeyError:
             return f"Error: Unknown card '{card_name}'"
         
-        entry = self.entries[card_name]
-        
         if player_name in entry.player_status:
-            entry.player_status[player_name] = CardStatus.NOT_HAS
+            entry.player_status[player_name] = _NOT_HAS
+            # Overriding a HAS: this player is no longer the known owner
+            if entry.owner == player_name:
+                entry.owner = None
+            self._dirty_rows[card_name] = None
         else:
             return f"Error: Unknown player '{player_name}'"
         
-        self._log(f"MARKED: {player_name} does NOT have '{card_name}'")
+        if self.verbose:
+            self._log(f"MARKED: {player_name} does NOT have '{card_name}'")
         self._check_deductions()
         
         return f"✗ Marked: {player_name} does NOT have '{card_name}'"
@@ -228,18 +306,31 @@ class DetectiveNotebook:
         
         deductions = []
         
+        # All marks below are written directly; deductions run once at the end.
         # If someone showed ME a card, mark it
         if card_shown and disprover:
-            self.mark_card(card_shown, disprover)
+            shown_entry = self.entries.get(card_shown)
+            if shown_entry is not None and self._apply_has(shown_entry, disprover) and self.verbose:
+                self._log(f"MARKED: {disprover} HAS '{card_shown}'")
             deductions.append(f"✓ {disprover} has '{card_shown}'")
         
-        # Players who passed don't have ANY of the suggested cards
+        # Players who passed don't have ANY of the suggested cards:
+        # collect every still-unknown (player, card) cell, then write them all
         if players_who_passed:
-            for player in players_who_passed:
-                for card in [suspect, weapon, room]:
-                    if self.entries[card].player_status.get(player) == CardStatus.UNKNOWN:
-                        self.mark_not_has(card, player)
-                        deductions.append(f"✗ {player} doesn't have '{card}' (passed)")
+            rows = [(card, self.entries[card].player_status) for card in (suspect, weapon, room)]
+            newly_not_has = [
+                (player, card, status)
+                for player in dict.fromkeys(players_who_passed)
+                for card, status in rows
+                if status.get(player) is _UNKNOWN
+            ]
+            verbose = self.verbose
+            for player, card, status in newly_not_has:
+                status[player] = _NOT_HAS
+                self._dirty_rows[card] = None
+                if verbose:
+                    self._log(f"MARKED: {player} does NOT have '{card}'")
+                deductions.append(f"✗ {player} doesn't have '{card}' (passed)")
         
         self._log(f"SUGGESTION #{len(self.suggestion_log)}: {suggester} suggested {suspect}/{weapon}/{room}")
         if disprover:
@@ -260,30 +351,33 @@ class DetectiveNotebook:
     def _check_deductions(self):
         """
         Run deduction logic to infer new information.
-        Called after any update to check for new conclusions.
+        Called after any update to check for new conclusions, so it also
+        drops the cached summaries.
+        
+        Both rules only look at a single card's row, and rule 2 can never
+        re-trigger rule 1, so one pass over the rows written since the last
+        check (self._dirty_rows) reaches the fixed point.
         """
-        changed = True
-        while changed:
-            changed = False
-            
-            for card_name, entry in self.entries.items():
-                # Deduction 1: If all players marked NOT_HAS, card is in ENVELOPE
-                if entry.envelope_status == CardStatus.UNKNOWN:
-                    all_not_has = all(
-                        s == CardStatus.NOT_HAS 
-                        for s in entry.player_status.values()
-                    )
-                    if all_not_has:
-                        entry.envelope_status = CardStatus.HAS
+        self._cache.clear()
+        for card_name in self._dirty_rows:
+            entry = self.entries[card_name]
+            # Deduction 1: If all players marked NOT_HAS, card is in ENVELOPE
+            if entry.envelope_status is _UNKNOWN:
+                statuses = entry.player_status.values()
+                all_not_has = (
+                    _UNKNOWN not in statuses
+                    and _HAS not in statuses
+                )
+                if all_not_has:
+                    entry.envelope_status = _HAS
+                    entry.owner = ENVELOPE
+                    if self.verbose:
                         self._log(f"DEDUCED: '{card_name}' is in the ENVELOPE!")
-                        changed = True
-                
-                # Deduction 2: If envelope has card, no player has it
-                if entry.envelope_status == CardStatus.HAS:
-                    for player in self.all_players:
-                        if entry.player_status[player] != CardStatus.NOT_HAS:
-                            entry.player_status[player] = CardStatus.NOT_HAS
-                            changed = True
+            
+            # Deduction 2: If envelope has card, no player has it
+            if entry.envelope_status is _HAS:
+                entry.player_status.update(self._all_not_has)
+        self._dirty_rows.clear()
     
     def get_unknown_cards(self) -> str:
         """
@@ -293,21 +387,50 @@ class DetectiveNotebook:
         Returns:
             List of unknown cards grouped by type
         """
-        unknown = {"suspect": [], "weapon": [], "room": []}
+        return self._cached("unknown_cards", self._build_unknown_cards)
+    
+    def _build_unknown_cards(self) -> str:
+        """Uncached body of get_unknown_cards."""
+        unknown = {
+            card_type: [e.card_name for e in entries if not e.is_solved()]
+            for card_type, entries in self._entries_by_type.items()
+        }
         
-        for card_name, entry in self.entries.items():
-            if not entry.is_solved():
-                unknown[entry.card_type].append(card_name)
+        parts = ["=== UNKNOWN CARDS ===\n"]
+        for card_type, label in (("suspect", "Suspects"), ("weapon", "Weapons"), ("room", "Rooms")):
+            cards = unknown[card_type]
+            parts.append(f"{label} ({len(cards)} unknown):")
+            if cards:
+                parts.append("  " + ", ".join(cards) + "\n")
+            else:
+                parts.append(f"  All {label.lower()} accounted for!\n")
         
-        result = "=== UNKNOWN CARDS ===\n\n"
-        result += f"Suspects ({len(unknown['suspect'])} unknown):\n"
-        result += "  " + ", ".join(unknown['suspect']) if unknown['suspect'] else "  All suspects accounted for!"
-        result += f"\n\nWeapons ({len(unknown['weapon'])} unknown):\n"
-        result += "  " + ", ".join(unknown['weapon']) if unknown['weapon'] else "  All weapons accounted for!"
-        result += f"\n\nRooms ({len(unknown['room'])} unknown):\n"
-        result += "  " + ", ".join(unknown['room']) if unknown['room'] else "  All rooms accounted for!"
+        return "\n".join(parts).rstrip("\n")
+    
+    def _compute_solution_state(self) -> tuple[dict, dict]:
+        """
+        Scan for envelope cards per card type, memoized until the next update.
         
-        return result
+        Returns:
+            (confirmed, possible): confirmed maps type -> card known to be in
+            the envelope (or None); possible maps type -> cards that could
+            still be. Shared between callers, so treat as read-only.
+        """
+        def scan() -> tuple[dict, dict]:
+            possible = {"suspect": [], "weapon": [], "room": []}
+            confirmed = {"suspect": None, "weapon": None, "room": None}
+            
+            for card_type, entries in self._entries_by_type.items():
+                for entry in entries:
+                    # If confirmed in envelope
+                    if entry.envelope_status is _HAS:
+                        confirmed[card_type] = entry.card_name
+                    # If not confirmed held by anyone, it COULD be in envelope
+                    elif entry.envelope_status is not _NOT_HAS and entry.owner is None:
+                        possible[card_type].append(entry.card_name)
+            return confirmed, possible
+        
+        return self._cached("solution_state", scan)
     
     def get_possible_solution(self) -> str:
         """
@@ -316,43 +439,23 @@ class DetectiveNotebook:
         Returns:
             Possible solution cards and confidence level
         """
-        possible = {"suspect": [], "weapon": [], "room": []}
-        confirmed = {"suspect": None, "weapon": None, "room": None}
-        
-        for card_name, entry in self.entries.items():
-            # If confirmed in envelope
-            if entry.envelope_status == CardStatus.HAS:
-                confirmed[entry.card_type] = card_name
-            # If not confirmed held by anyone, it COULD be in envelope
-            elif entry.envelope_status != CardStatus.NOT_HAS:
-                if not any(s == CardStatus.HAS for s in entry.player_status.values()):
-                    possible[entry.card_type].append(card_name)
-        
-        result = "=== POSSIBLE SOLUTION ===\n\n"
-        
-        # Suspect
-        if confirmed["suspect"]:
-            result += f"SUSPECT: *** {confirmed['suspect']} *** (CONFIRMED!)\n"
-        elif len(possible["suspect"]) == 1:
-            result += f"SUSPECT: {possible['suspect'][0]} (only possibility!)\n"
-        else:
-            result += f"SUSPECT: {len(possible['suspect'])} possibilities - {', '.join(possible['suspect'])}\n"
-        
-        # Weapon
-        if confirmed["weapon"]:
-            result += f"WEAPON: *** {confirmed['weapon']} *** (CONFIRMED!)\n"
-        elif len(possible["weapon"]) == 1:
-            result += f"WEAPON: {possible['weapon'][0]} (only possibility!)\n"
-        else:
-            result += f"WEAPON: {len(possible['weapon'])} possibilities - {', '.join(possible['weapon'])}\n"
-        
-        # Room
-        if confirmed["room"]:
-            result += f"ROOM: *** {confirmed['room']} *** (CONFIRMED!)\n"
-        elif len(possible["room"]) == 1:
-            result += f"ROOM: {possible['room'][0]} (only possibility!)\n"
-        else:
-            result += f"ROOM: {len(possible['room'])} possibilities - {', '.join(possible['room'])}\n"
+        return self._cached("possible_solution", self._build_possible_solution)
+    
+    def _build_possible_solution(self) -> str:
+        """Uncached body of get_possible_solution."""
+        confirmed, possible = self._compute_solution_state()
+        
+        parts = ["=== POSSIBLE SOLUTION ===\n"]
+        
+        for label, key in (("SUSPECT", "suspect"), ("WEAPON", "weapon"), ("ROOM", "room")):
+            known = confirmed[key]
+            options = possible[key]
+            if known:
+                parts.append(f"{label}: *** {known} *** (CONFIRMED!)")
+            elif len(options) == 1:
+                parts.append(f"{label}: {options[0]} (only possibility!)")
+            else:
+                parts.append(f"{label}: {len(options)} possibilities - {', '.join(options)}")
         
         # Check if we can make an accusation
         can_accuse = (
@@ -362,13 +465,15 @@ class DetectiveNotebook:
         )
         
         if can_accuse:
-            result += "\n🎯 YOU CAN MAKE AN ACCUSATION! All three are narrowed to one option!"
             final_suspect = confirmed["suspect"] or possible["suspect"][0]
             final_weapon = confirmed["weapon"] or possible["weapon"][0]
             final_room = confirmed["room"] or possible["room"][0]
-            result += f"\n   -> Accuse: {final_suspect} with {final_weapon} in {final_room}"
+            parts.append("\n🎯 YOU CAN MAKE AN ACCUSATION! All three are narrowed to one option!")
+            parts.append(f"   -> Accuse: {final_suspect} with {final_weapon} in {final_room}")
+        else:
+            parts.append("")
         
-        return result
+        return "\n".join(parts)
     
     def get_accusation_recommendation(self) -> dict:
         """
@@ -377,17 +482,13 @@ class DetectiveNotebook:
         Returns:
             Dict with 'can_accuse', 'suspect', 'weapon', 'room', and 'reason'
         """
-        possible = {"suspect": [], "weapon": [], "room": []}
-        confirmed = {"suspect": None, "weapon": None, "room": None}
-        
-        for card_name, entry in self.entries.items():
-            # If confirmed in envelope
-            if entry.envelope_status == CardStatus.HAS:
-                confirmed[entry.card_type] = card_name
-            # If not confirmed held by anyone, it COULD be in envelope
-            elif entry.envelope_status != CardStatus.NOT_HAS:
-                if not any(s == CardStatus.HAS for s in entry.player_status.values()):
-                    possible[entry.card_type].append(card_name)
+        return _fresh_result(
+            self._cached("accusation_recommendation", self._build_accusation_recommendation)
+        )
+    
+    def _build_accusation_recommendation(self) -> dict:
+        """Uncached body of get_accusation_recommendation."""
+        confirmed, possible = self._compute_solution_state()
         
         # Check if we can make an accusation
         can_accuse = (
@@ -418,9 +519,9 @@ class DetectiveNotebook:
                 "suspect": None,
                 "weapon": None,
                 "room": None,
-                "possible_suspects": possible["suspect"],
-                "possible_weapons": possible["weapon"],
-                "possible_rooms": possible["room"],
+                "possible_suspects": list(possible["suspect"]),
+                "possible_weapons": list(possible["weapon"]),
+                "possible_rooms": list(possible["room"]),
                 "reason": "; ".join(reasons) if reasons else "Need more information"
             }
     
@@ -439,18 +540,20 @@ class DetectiveNotebook:
         warnings = []
         
         # Check each card against notebook knowledge
-        for card_name, card_type in [(suspect, "suspect"), (weapon, "weapon"), (room, "room")]:
-            if card_name in self.entries:
+        for card_name in (suspect, weapon, room):
+            try:
                 entry = self.entries[card_name]
-                
-                # If someone has this card, it's definitely NOT the solution
-                if any(s == CardStatus.HAS for s in entry.player_status.values()):
-                    owner = entry.get_owner()
-                    warnings.append(f"❌ {card_name} is held by {owner} - CANNOT be in envelope!")
-                
-                # If envelope is marked as NOT having it
-                if entry.envelope_status == CardStatus.NOT_HAS:
-                    warnings.append(f"❌ {card_name} is marked as NOT in envelope!")
+            except KeyError:
+                continue
+            
+            # If someone has this card, it's definitely NOT the solution
+            if entry.held_by_player():
+                owner = entry.owner
+                warnings.append(f"❌ {card_name} is held by {owner} - CANNOT be in envelope!")
+            
+            # If envelope is marked as NOT having it
+            if entry.envelope_status is _NOT_HAS:
+                warnings.append(f"❌ {card_name} is marked as NOT in envelope!")
         
         recommendation = self.get_accusation_recommendation()
         
@@ -482,39 +585,46 @@ class DetectiveNotebook:
         Returns:
             Dict with 'valid', 'warnings', 'wasted_cards', and 'better_alternatives'
         """
+        # Agents often repeat a suggestion across turns; reuse the verdict
+        # until a notebook update could change it
+        return _fresh_result(self._cached(
+            ("validate_suggestion", suspect, weapon, room),
+            lambda: self._build_suggestion_check(suspect, weapon, room),
+        ))
+    
+    def _build_suggestion_check(self, suspect: str, weapon: str, room: str) -> dict:
+        """Uncached body of validate_suggestion."""
         warnings = []
         wasted_cards = []
-        alternatives = {"suspect": [], "weapon": [], "room": []}
         
         # Check each card against notebook knowledge
-        for card_name, card_type in [(suspect, "suspect"), (weapon, "weapon"), (room, "room")]:
-            if card_name in self.entries:
+        for card_name in (suspect, weapon, room):
+            try:
                 entry = self.entries[card_name]
-                
-                # If someone has this card, suggesting it is wasteful
-                if any(s == CardStatus.HAS for s in entry.player_status.values()):
-                    owner = entry.get_owner()
-                    wasted_cards.append(card_name)
-                    warnings.append(f"⚠️ {card_name} is already known to be held by {owner} - suggesting it won't give you new info!")
-                
-                # If envelope is confirmed to NOT have it, also wasteful
-                elif entry.envelope_status == CardStatus.NOT_HAS:
-                    wasted_cards.append(card_name)
-                    warnings.append(f"⚠️ {card_name} is already eliminated from the solution!")
-        
-        # Find better alternatives (cards still unknown)
-        for card_name, entry in self.entries.items():
-            if not entry.is_solved() and entry.envelope_status != CardStatus.NOT_HAS:
-                if not any(s == CardStatus.HAS for s in entry.player_status.values()):
-                    alternatives[entry.card_type].append(card_name)
+            except KeyError:
+                continue
+            
+            # If someone has this card, suggesting it is wasteful
+            if entry.held_by_player():
+                owner = entry.owner
+                wasted_cards.append(card_name)
+                warnings.append(f"⚠️ {card_name} is already known to be held by {owner} - suggesting it won't give you new info!")
+            
+            # If envelope is confirmed to NOT have it, also wasteful
+            elif entry.envelope_status is _NOT_HAS:
+                wasted_cards.append(card_name)
+                warnings.append(f"⚠️ {card_name} is already eliminated from the solution!")
         
         if warnings:
+            # Better alternatives are the cards that could still be in the
+            # envelope - only needed when there is something to replace
+            _, possible = self._compute_solution_state()
             return {
                 "valid": False,
                 "warnings": warnings,
                 "wasted_cards": wasted_cards,
-                "better_suspects": alternatives["suspect"],
-                "better_weapons": alternatives["weapon"],
+                "better_suspects": list(possible["suspect"]),
+                "better_weapons": list(possible["weapon"]),
                 "message": "This suggestion includes cards you already know about!"
             }
         else:
@@ -532,32 +642,23 @@ class DetectiveNotebook:
         Returns:
             Formatted grid of all card statuses
         """
-        result = "=== DETECTIVE NOTEBOOK GRID ===\n"
-        result += f"(Owner: {self.owner_name})\n\n"
-        
-        # Header
-        header = "Card".ljust(20)
-        for player in self.all_players:
-            header += player[:8].center(10)
-        header += "ENVELOPE".center(10)
-        result += header + "\n"
-        result += "=" * len(header) + "\n"
+        buf = io.StringIO()
+        write = buf.write
+        write(self._grid_header)
         
         # Group by type
-        for card_type in ["suspect", "weapon", "room"]:
-            result += f"\n--- {card_type.upper()}S ---\n"
-            for card_name, entry in self.entries.items():
-                if entry.card_type == card_type:
-                    row = card_name.ljust(20)
-                    for player in self.all_players:
-                        status = entry.player_status[player]
-                        row += status.value.center(10)
-                    row += entry.envelope_status.value.center(10)
-                    result += row + "\n"
-        
-        result += "\nLegend: ✓=Has  ✗=Doesn't have  ?=Unknown\n"
-        
-        return result
+        for card_type, entries in self._entries_by_type.items():
+            write(_SECTION_HEADER[card_type])
+            for entry in entries:
+                write(entry.card_name.ljust(20))
+                for status in entry.player_status.values():
+                    write(_STATUS_CELL[status])
+                write(_STATUS_CELL[entry.envelope_status])
+                write("\n")
+        
+        write(_GRID_LEGEND)
+        
+        return buf.getvalue()
     
     def get_suggestion_history(self) -> str:
         """
@@ -569,22 +670,31 @@ class DetectiveNotebook:
         if not self.suggestion_log:
             return "No suggestions have been recorded yet."
         
-        result = "=== SUGGESTION HISTORY ===\n\n"
-        for i, sugg in enumerate(self.suggestion_log, 1):
-            result += f"Turn {sugg['turn']}: {sugg['suggester']} suggested:\n"
-            result += f"  {sugg['suspect']} with {sugg['weapon']} in {sugg['room']}\n"
-            if sugg['disprover']:
-                result += f"  -> Disproved by {sugg['disprover']}"
-                if sugg['card_shown']:
-                    result += f" (showed: {sugg['card_shown']})"
-                result += "\n"
-            else:
-                result += "  -> NOT DISPROVED!\n"
-            if sugg['players_passed']:
-                result += f"  -> Passed: {', '.join(sugg['players_passed'])}\n"
-            result += "\n"
+        # Records are immutable once logged, so only format the new ones
+        lines = self._history_lines
+        for sugg in self.suggestion_log[len(lines):]:
+            lines.append(self._format_history_entry(sugg))
         
-        return result
+        return "=== SUGGESTION HISTORY ===\n\n" + "".join(lines)
+    
+    @staticmethod
+    def _format_history_entry(sugg: dict) -> str:
+        """Format one suggestion_log record for the history view."""
+        parts = [
+            f"Turn {sugg['turn']}: {sugg['suggester']} suggested:\n",
+            f"  {sugg['suspect']} with {sugg['weapon']} in {sugg['room']}\n",
+        ]
+        if sugg['disprover']:
+            parts.append(f"  -> Disproved by {sugg['disprover']}")
+            if sugg['card_shown']:
+                parts.append(f" (showed: {sugg['card_shown']})")
+            parts.append("\n")
+        else:
+            parts.append("  -> NOT DISPROVED!\n")
+        if sugg['players_passed']:
+            parts.append(f"  -> Passed: {', '.join(sugg['players_passed'])}\n")
+        parts.append("\n")
+        return "".join(parts)
     
     def get_turn_log(self) -> str:
         """
@@ -596,15 +706,22 @@ class DetectiveNotebook:
         if not self.turn_log:
             return "No events logged yet."
         
-        result = "=== EVENT LOG ===\n\n"
-        for i, event in enumerate(self.turn_log, 1):
-            result += f"{i}. {event}\n"
-        
-        return result
+        return "=== EVENT LOG ===\n\n" + "".join(
+            f"{i}. {event}\n" for i, event in enumerate(self.turn_log, 1)
+        )
+    
+    def _cached(self, key: str | tuple, build):
+        """Return build() memoized until the notebook state next changes."""
+        try:
+            return self._cache[key]
+        except KeyError:
+            result = self._cache[key] = build()
+            return result
     
     def _log(self, message: str):
-        """Add an event to the log."""
-        self.turn_log.append(message)
+        """Add an event to the log (no-op unless verbose)."""
+        if self.verbose:
+            self.turn_log.append(message)
     
     def get_strategic_suggestion(self, current_room: str) -> str:
         """
@@ -617,57 +734,101 @@ class DetectiveNotebook:
         Returns:
             Recommended suggestion
         """
-        unknown = {"suspect": [], "weapon": []}
-        
-        for card_name, entry in self.entries.items():
-            if entry.card_type in ["suspect", "weapon"] and not entry.is_solved():
-                unknown[entry.card_type].append(card_name)
+        unknown = {
+            card_type: [e.card_name for e in self._entries_by_type[card_type] if not e.is_solved()]
+            for card_type in ("suspect", "weapon")
+        }
         
-        result = f"=== STRATEGIC SUGGESTION for {current_room} ===\n\n"
+        parts = [f"=== STRATEGIC SUGGESTION for {current_room} ===\n\n"]
         
         if not unknown["suspect"]:
-            result += "⚠️ All suspects are accounted for!\n"
+            parts.append("⚠️ All suspects are accounted for!\n")
         else:
-            result += f"Unknown suspects to test: {', '.join(unknown['suspect'])}\n"
-            result += f"Recommend: {unknown['suspect'][0]}\n"
+            parts.append(f"Unknown suspects to test: {', '.join(unknown['suspect'])}\n")
+            parts.append(f"Recommend: {unknown['suspect'][0]}\n")
         
         if not unknown["weapon"]:
-            result += "⚠️ All weapons are accounted for!\n"
+            parts.append("⚠️ All weapons are accounted for!\n")
         else:
-            result += f"Unknown weapons to test: {', '.join(unknown['weapon'])}\n"
-            result += f"Recommend: {unknown['weapon'][0]}\n"
+            parts.append(f"Unknown weapons to test: {', '.join(unknown['weapon'])}\n")
+            parts.append(f"Recommend: {unknown['weapon'][0]}\n")
         
         if unknown["suspect"] and unknown["weapon"]:
-            result += f"\n🎯 Suggested: '{unknown['suspect'][0]}' with '{unknown['weapon'][0]}' in '{current_room}'"
+            parts.append(f"\n🎯 Suggested: '{unknown['suspect'][0]}' with '{unknown['weapon'][0]}' in '{current_room}'")
         
-        return result
+        return "".join(parts)
+
+
+# Default player columns for notebooks created without a player list
+_DEFAULT_PLAYERS = ["Scarlet", "Mustard", "Green", "Peacock", "Plum", "White"]
+
+
+class _NotebookRegistry:
+    """Holds every player's notebook for the current game."""
+    
+    __slots__ = ("_books",)
+    
+    def __init__(self):
+        self._books: dict[str, DetectiveNotebook] = {}
+    
+    def get(self, player_name: str, all_players: list[str] = None) -> DetectiveNotebook:
+        """Get or create a player's notebook."""
+        books = self._books
+        if player_name not in books:
+            if all_players is None:
+                all_players = _DEFAULT_PLAYERS
+            books[player_name] = DetectiveNotebook(player_name, all_players)
+        return books[player_name]
+    
+    def find(self, player_name: str) -> Optional[DetectiveNotebook]:
+        """Get a player's notebook if it exists, without creating it."""
+        return self._books.get(player_name)
+    
+    def reset(self, player_name: str) -> None:
+        """Drop a single player's notebook."""
+        self._books.pop(player_name, None)
+    
+    def reset_all(self) -> None:
+        """Drop every notebook."""
+        self._books = {}
+    
+    def broadcast_card_shown(self, card_name: str, card_holder: str) -> None:
+        """Mark card_holder as holding card_name in every notebook."""
+        self.broadcast_cards_shown(((card_name, card_holder),))
+    
+    def broadcast_cards_shown(self, pairs) -> None:
+        """Apply several (card_name, card_holder) reveals in one pass over the notebooks."""
+        for notebook in self._books.values():
+            for card_name, card_holder in pairs:
+                try:
+                    notebook.mark_card(card_name, card_holder)
+                except Exception:
+                    # If notebook doesn't have this card tracked yet, skip
+                    pass
 
 
 # Global storage for player notebooks
-_player_notebooks: dict[str, DetectiveNotebook] = {}
+_REGISTRY = _NotebookRegistry()
 
 
 def get_notebook(player_name: str, all_players: list[str] = None) -> DetectiveNotebook:
     """Get or create a player's notebook."""
-    global _player_notebooks
-    if player_name not in _player_notebooks:
-        if all_players is None:
-            all_players = ["Scarlet", "Mustard", "Green", "Peacock", "Plum", "White"]
-        _player_notebooks[player_name] = DetectiveNotebook(player_name, all_players)
-    return _player_notebooks[player_name]
+    return _REGISTRY.get(player_name, all_players)
+
+
+def find_notebook(player_name: str) -> Optional[DetectiveNotebook]:
+    """Get a player's existing notebook, or None if they don't have one yet."""
+    return _REGISTRY.find(player_name)
 
 
 def reset_notebook(player_name: str):
     """Reset a specific player's notebook."""
-    global _player_notebooks
-    if player_name in _player_notebooks:
-        del _player_notebooks[player_name]
+    _REGISTRY.reset(player_name)
 
 
 def reset_all_notebooks():
     """Reset all notebooks for a new game."""
-    global _player_notebooks
-    _player_notebooks = {}
+    _REGISTRY.reset_all()
 
 
 def update_all_notebooks_card_shown(card_name: str, card_holder: str) -> None:
@@ -685,10 +846,17 @@ def update_all_notebooks_card_shown(card_name: str, card_holder: str) -> None:
         card_name: The name of the card that was shown
         card_holder: The name of the player who holds this card
     """
-    global _player_notebooks
-    for player_name, notebook in _player_notebooks.items():
-        try:
-            notebook.mark_card(card_name, card_holder)
-        except Exception:
-            # If notebook doesn't have this card tracked yet, skip
-            pass
+    _REGISTRY.broadcast_card_shown(card_name, card_holder)
+
+
+def update_all_notebooks_cards_shown(pairs: list[tuple[str, str]]) -> None:
+    """
+    Update all player notebooks with several revealed cards at once.
+    
+    Same as calling update_all_notebooks_card_shown for each pair, but walks
+    the notebooks only once (e.g. for a double magnifying-glass roll).
+    
+    Args:
+        pairs: (card_name, card_holder) tuples
+    """
+    _REGISTRY.broadcast_cards_shown(pairs)
@@ -17,7 +17,69 @@ from clue_game.game_state import (
     STARTING_POSITION_NAMES, STARTING_POSITION_MOVES, STARTING_GRID_POSITIONS,
     DOOR_POSITIONS, get_cell_type, CellType, BOARD_WIDTH, BOARD_HEIGHT
 )
-from clue_game.notebook import get_notebook, update_all_notebooks_card_shown
+from clue_game.notebook import (
+    find_notebook, update_all_notebooks_card_shown, update_all_notebooks_cards_shown
+)
+
+
+# Case-insensitive name -> enum lookups for validating agent input
+_ROOM_BY_LOWER = {r.value.lower(): r for r in Room}
+_SUSPECT_BY_LOWER = {s.value.lower(): s for s in Suspect}
+_WEAPON_BY_LOWER = {w.value.lower(): w for w in Weapon}
+
+# Card names in enum order, for listing every option
+_SUSPECT_NAMES = tuple(s.value for s in Suspect)
+_WEAPON_NAMES = tuple(w.value for w in Weapon)
+_ROOM_NAMES = tuple(r.value for r in Room)
+_VALID_ROOM_NAMES = ", ".join(_ROOM_NAMES)
+_VALID_SUSPECT_NAMES = ", ".join(_SUSPECT_NAMES)
+_VALID_WEAPON_NAMES = ", ".join(_WEAPON_NAMES)
+
+# Get My Knowledge rows: (heading, ((name, "[name] ", "name, "), ...)) per card type
+_KNOWLEDGE_SECTIONS = tuple(
+    (heading, tuple((name, f"[{name}] ", f"{name}, ") for name in names))
+    for heading, names in (("\nSuspects: ", _SUSPECT_NAMES),
+                           ("\n\nWeapons: ", _WEAPON_NAMES),
+                           ("\n\nRooms: ", _ROOM_NAMES))
+)
+
+# The Get Valid Options reply never changes, so it is formatted once
+_VALID_OPTIONS = f"""Valid Options:
+
+SUSPECTS: {_VALID_SUSPECT_NAMES}
+
+WEAPONS: {_VALID_WEAPON_NAMES}
+
+ROOMS: {_VALID_ROOM_NAMES}
+"""
+
+
+def _get_player(player_name: str):
+    """
+    Common tool prologue: fetch the game and the calling player.
+    
+    Returns:
+        (game_state, player, None), or (game_state, None, error message) if
+        no player has that name
+    """
+    game_state = get_game_state()
+    player = game_state.get_player_by_name(player_name)
+    if not player:
+        return game_state, None, f"Error: Player {player_name} not found"
+    return game_state, player, None
+
+
+def _resolve(name: str, table: dict, kind: str, valid_names: str):
+    """
+    Look up a card enum by case-insensitive name.
+    
+    Returns:
+        (member, None) if found, otherwise (None, error message for the agent)
+    """
+    member = table.get(name.lower())
+    if member is None:
+        return None, f"Error: Invalid {kind} '{name}'. Valid {kind}s: {valid_names}"
+    return member, None
 
 
 @tool("Get My Cards")
@@ -32,22 +94,26 @@ def get_my_cards(player_name: str) -> str:
     Returns:
         List of cards in your hand
     """
-    game_state = get_game_state()
-    player = game_state.get_player_by_name(player_name)
-    
-    if not player:
-        return f"Error: Player {player_name} not found"
+    game_state, player, error = _get_player(player_name)
+    if error:
+        return error
     
-    cards_by_type = {"suspect": [], "weapon": [], "room": []}
+    suspects, weapons, rooms = [], [], []
     for card in player.cards:
-        cards_by_type[card.card_type].append(card.name)
-    
-    result = f"Your cards ({len(player.cards)} total):\n"
-    result += f"  Suspects: {', '.join(cards_by_type['suspect']) or 'None'}\n"
-    result += f"  Weapons: {', '.join(cards_by_type['weapon']) or 'None'}\n"
-    result += f"  Rooms: {', '.join(cards_by_type['room']) or 'None'}"
-    
-    return result
+        card_type = card.card_type
+        if card_type == "suspect":
+            suspects.append(card.name)
+        elif card_type == "weapon":
+            weapons.append(card.name)
+        else:
+            rooms.append(card.name)
+    
+    return (
+        f"Your cards ({len(player.cards)} total):\n"
+        f"  Suspects: {', '.join(suspects) if suspects else 'None'}\n"
+        f"  Weapons: {', '.join(weapons) if weapons else 'None'}\n"
+        f"  Rooms: {', '.join(rooms) if rooms else 'None'}"
+    )
 
 
 @tool("Get Current Location")
@@ -61,46 +127,45 @@ def get_current_location(player_name: str) -> str:
     Returns:
         Your current room or grid position in the hallway
     """
-    game_state = get_game_state()
-    player = game_state.get_player_by_name(player_name)
-    
-    if not player:
-        return f"Error: Player {player_name} not found"
-    
-    if player.current_room and not player.in_hallway:
-        result = f"📍 You are currently in the {player.current_room.value}\n"
-        result += f"   Moves remaining: {player.moves_remaining}\n"
+    game_state, player, error = _get_player(player_name)
+    if error:
+        return error
+    
+    cur_room = player.current_room
+    if cur_room and not player.in_hallway:
+        parts = [
+            f"📍 You are currently in the {cur_room.value}\n",
+            f"   Moves remaining: {player.moves_remaining}\n",
+        ]
         if player.was_moved_by_suggestion:
-            result += "\n(You were moved here by another player's suggestion - you may suggest immediately without moving)"
+            parts.append("\n(You were moved here by another player's suggestion - you may suggest immediately without moving)")
         
         # Show exits
-        doors = game_state.get_room_doors(player.current_room)
+        doors = game_state.get_room_doors(cur_room)
         if doors:
-            result += f"\n🚪 Room exits: {len(doors)} door(s)"
-        if player.current_room in SECRET_PASSAGES:
-            dest = SECRET_PASSAGES[player.current_room]
-            result += f"\n🔑 Secret passage to: {dest.value}"
-        return result
+            parts.append(f"\n🚪 Room exits: {len(doors)} door(s)")
+        dest = SECRET_PASSAGES.get(cur_room)
+        if dest:
+            parts.append(f"\n🔑 Secret passage to: {dest.value}")
+        return "".join(parts)
     else:
         # Player is in hallway
         if player.position:
-            result = f"📍 You are in the hallway at position ({player.position[0]}, {player.position[1]})\n"
+            parts = [f"📍 You are in the hallway at position ({player.position[0]}, {player.position[1]})\n"]
         else:
-            start_name = STARTING_POSITION_NAMES.get(player.character, "hallway")
-            result = f"📍 You are at your START position: {start_name}\n"
+            parts = [f"📍 You are at your START position: {player.start_name}\n"]
         
-        result += f"   Moves remaining: {player.moves_remaining}\n"
-        result += f"\nYou must enter a room to make a suggestion."
+        parts.append(f"   Moves remaining: {player.moves_remaining}\n")
+        parts.append("\nYou must enter a room to make a suggestion.")
         
         # Show nearby rooms if they have moves
         if player.moves_remaining > 0:
             reachable = game_state.get_reachable_rooms(player)
             if reachable:
-                result += f"\n\n🚪 Rooms within reach:"
-                for room, distance, _ in reachable:
-                    result += f"\n   • {room.value} ({distance} steps)"
+                parts.append("\n\n🚪 Rooms within reach:")
+                parts.extend(f"\n   • {room.value} ({distance} steps)" for room, distance, _ in reachable)
         
-        return result
+        return "".join(parts)
 
 
 @tool("Roll Dice")
@@ -124,11 +189,9 @@ def roll_dice(player_name: str) -> str:
     Returns:
         The dice roll result, movement allowance, and reachable rooms
     """
-    game_state = get_game_state()
-    player = game_state.get_player_by_name(player_name)
-    
-    if not player:
-        return f"Error: Player {player_name} not found"
+    game_state, player, error = _get_player(player_name)
+    if error:
+        return error
     
     die1, die2, magnifying_count = game_state.roll_dice()
     
@@ -142,85 +205,87 @@ def roll_dice(player_name: str) -> str:
     # Start the turn with the dice total
     game_state.start_turn(player, total)
     
-    # Print dice roll to console for visibility
-    sys.stdout.write(f"\n    🎲 {player_name} rolled: {die1_display} + {die2_display} = {total} movement spaces\n")
-    sys.stdout.flush()
+    # Console lines for visibility, written in one go once any clues are drawn
+    console = [f"\n    🎲 {player_name} rolled: {die1_display} + {die2_display} = {total} movement spaces\n"]
     
-    result = f"🎲 DICE ROLL: {die1_display} + {die2_display} = {total} movement spaces\n\n"
+    parts = [f"🎲 DICE ROLL: {die1_display} + {die2_display} = {total} movement spaces\n\n"]
     
     # Handle magnifying glass clues
     if magnifying_count > 0:
-        result += f"🔍 MAGNIFYING GLASS {'x2' if magnifying_count == 2 else ''}!\n"
-        result += "You get a free clue about the mystery!\n\n"
-        sys.stdout.write(f"    🔍 MAGNIFYING GLASS! {player_name} gets a free clue!\n")
+        parts.append(f"🔍 MAGNIFYING GLASS {'x2' if magnifying_count == 2 else ''}!\n")
+        parts.append("You get a free clue about the mystery!\n\n")
+        console.append(f"    🔍 MAGNIFYING GLASS! {player_name} gets a free clue!\n")
         
+        clue_updates = []
+        get_clue = game_state.get_random_clue
         for _ in range(magnifying_count):
-            clue_result = game_state.get_random_clue(player)
+            clue_result = get_clue(player)
             if clue_result:
-                clue_text, holder_name = clue_result
+                clue_text, holder_name, card_name = clue_result
                 if holder_name:
-                    result += f"  💡 CLUE: {clue_text} (shown by {holder_name})\n"
-                    sys.stdout.write(f"    💡 CLUE: {clue_text} (shown by {holder_name})\n")
-                    # Extract card name from clue text (format: "CardName is NOT the murder type")
-                    card_name = clue_text.split(" is NOT")[0]
-                    # Update all players' notebooks with this information
-                    update_all_notebooks_card_shown(card_name, holder_name)
+                    parts.append(f"  💡 CLUE: {clue_text} (shown by {holder_name})\n")
+                    console.append(f"    💡 CLUE: {clue_text} (shown by {holder_name})\n")
+                    clue_updates.append((card_name, holder_name))
                 else:
-                    result += f"  💡 CLUE: {clue_text}\n"
-                    sys.stdout.write(f"    💡 CLUE: {clue_text}\n")
+                    parts.append(f"  💡 CLUE: {clue_text}\n")
+                    console.append(f"    💡 CLUE: {clue_text}\n")
             else:
-                result += f"  💡 CLUE: No additional clues available.\n"
-        result += "\n  📝 All players' notebooks have been updated with this clue.\n\n"
-        sys.stdout.flush()
+                parts.append("  💡 CLUE: No additional clues available.\n")
+        # Update all players' notebooks with every revealed card at once
+        update_all_notebooks_cards_shown(clue_updates)
+        parts.append("\n  📝 All players' notebooks have been updated with this clue.\n\n")
+    
+    sys.stdout.write("".join(console))
+    sys.stdout.flush()
     
     # Show current position and reachable rooms
-    if player.current_room and not player.in_hallway:
+    cur_room = player.current_room
+    if cur_room and not player.in_hallway:
         # Player is in a room - show room exits and secret passage
-        result += f"📍 You are in {player.current_room.value}\n"
-        result += f"   Moves available: {player.moves_remaining}\n\n"
+        parts.append(f"📍 You are in {cur_room.value}\n")
+        parts.append(f"   Moves available: {player.moves_remaining}\n\n")
         
         # Show door exits
-        doors = game_state.get_room_doors(player.current_room)
+        doors = game_state.get_room_doors(cur_room)
         if doors:
-            result += f"🚪 Room exits (doors):\n"
-            for door_pos in doors:
-                result += f"   • Door at position ({door_pos[0]}, {door_pos[1]})\n"
+            parts.append("🚪 Room exits (doors):\n")
+            parts.extend(f"   • Door at position ({door_pos[0]}, {door_pos[1]})\n" for door_pos in doors)
         
         # Show secret passage if available
-        if player.current_room in SECRET_PASSAGES:
-            dest = SECRET_PASSAGES[player.current_room]
-            result += f"\n🔑 SECRET PASSAGE available to {dest.value}!\n"
-            result += "   (Using the secret passage ends your movement)\n"
+        dest = SECRET_PASSAGES.get(cur_room)
+        if dest:
+            parts.append(f"\n🔑 SECRET PASSAGE available to {dest.value}!\n")
+            parts.append("   (Using the secret passage ends your movement)\n")
         
-        result += f"\n💡 Use 'Move To Room' to exit through a door and navigate to another room."
+        parts.append("\n💡 Use 'Move To Room' to exit through a door and navigate to another room.")
     else:
         # Player is in hallway - show reachable rooms
         if player.position:
-            result += f"📍 You are at position ({player.position[0]}, {player.position[1]}) in the hallway\n"
+            parts.append(f"📍 You are at position ({player.position[0]}, {player.position[1]}) in the hallway\n")
         else:
-            start_name = STARTING_POSITION_NAMES.get(player.character, "START")
-            result += f"📍 You are at {start_name}\n"
-        result += f"   Moves remaining: {player.moves_remaining}\n\n"
+            parts.append(f"📍 You are at {player.start_name}\n")
+        parts.append(f"   Moves remaining: {player.moves_remaining}\n\n")
         
         # Find reachable rooms
         reachable = game_state.get_reachable_rooms(player)
         if reachable:
-            result += "🚪 ROOMS YOU CAN REACH:\n"
-            for room, distance, path in reachable:
-                result += f"   • {room.value} - {distance} steps away\n"
+            parts.append("🚪 ROOMS YOU CAN REACH:\n")
+            parts.extend(f"   • {room.value} - {distance} steps away\n" for room, distance, _ in reachable)
         else:
-            result += "⚠️ No rooms reachable with current moves.\n"
-            result += "   You may need to move closer in the hallway.\n"
+            parts.append("⚠️ No rooms reachable with current moves.\n")
+            parts.append("   You may need to move closer in the hallway.\n")
         
-        result += f"\n💡 Use 'Move To Room' with a room name to navigate there."
+        parts.append("\n💡 Use 'Move To Room' with a room name to navigate there.")
     
-    result += "\n\n⚠️ MOVEMENT RULES:\n"
-    result += "   • Move only horizontal/vertical (no diagonal)\n"
-    result += "   • Cannot pass through occupied squares\n"
-    result += "   • Movement STOPS when entering a room\n"
-    result += "   • Cannot cross same square twice in one turn"
+    parts.append(
+        "\n\n⚠️ MOVEMENT RULES:\n"
+        "   • Move only horizontal/vertical (no diagonal)\n"
+        "   • Cannot pass through occupied squares\n"
+        "   • Movement STOPS when entering a room\n"
+        "   • Cannot cross same square twice in one turn"
+    )
     
-    return result
+    return "".join(parts)
 
 
 @tool("Get Available Moves")
@@ -241,11 +306,9 @@ def get_available_moves(player_name: str) -> str:
     Returns:
         List of rooms you can reach with current movement, with strategic recommendations
     """
-    game_state = get_game_state()
-    player = game_state.get_player_by_name(player_name)
-    
-    if not player:
-        return f"Error: Player {player_name} not found"
+    game_state, player, error = _get_player(player_name)
+    if error:
+        return error
     
     # Get rooms the player holds cards for (should avoid these for suggestions)
     rooms_in_hand = set()
@@ -253,111 +316,110 @@ def get_available_moves(player_name: str) -> str:
         if card.card_type == "room":
             rooms_in_hand.add(card.name)
     
-    result = "=== AVAILABLE MOVES ===\n\n"
+    parts = ["=== AVAILABLE MOVES ===\n\n"]
     
     # Show strategic advice upfront
     if rooms_in_hand:
-        result += "🎯 STRATEGIC ADVICE:\n"
-        result += f"   ⚠️ You hold these room cards: {', '.join(rooms_in_hand)}\n"
-        result += "   → AVOID these rooms! Suggesting there wastes your turn.\n"
-        result += "   → Move to rooms you DON'T have cards for to gather info.\n\n"
+        parts.append("🎯 STRATEGIC ADVICE:\n")
+        parts.append(f"   ⚠️ You hold these room cards: {', '.join(rooms_in_hand)}\n")
+        parts.append("   → AVOID these rooms! Suggesting there wastes your turn.\n")
+        parts.append("   → Move to rooms you DON'T have cards for to gather info.\n\n")
     
     # Show current location
-    if player.current_room and not player.in_hallway:
-        current = player.current_room.value
-        result += f"📍 Current location: {current}\n"
+    cur_room = player.current_room
+    if cur_room and not player.in_hallway:
+        current = cur_room.value
+        parts.append(f"📍 Current location: {current}\n")
         
         # Warn if current room is in hand
         if current in rooms_in_hand:
-            result += f"   ⚠️ WARNING: You hold the {current} card - leave this room!\n"
+            parts.append(f"   ⚠️ WARNING: You hold the {current} card - leave this room!\n")
         
         # Show doors to exit
-        doors = game_state.get_room_doors(player.current_room)
+        doors = game_state.get_room_doors(cur_room)
         occupied = game_state.get_occupied_positions(exclude_player=player)
         
         if doors:
-            result += f"\n🚪 Exits from {current}:\n"
-            for door_pos in doors:
-                if door_pos in occupied:
-                    result += f"   • Door at ({door_pos[0]}, {door_pos[1]}) - BLOCKED\n"
-                else:
-                    result += f"   • Door at ({door_pos[0]}, {door_pos[1]}) - Available\n"
+            blocked = occupied.intersection(doors)
+            parts.append(f"\n🚪 Exits from {current}:\n")
+            parts.extend(
+                f"   • Door at ({row}, {col}) - {'BLOCKED' if (row, col) in blocked else 'Available'}\n"
+                for row, col in doors
+            )
         
         # Show secret passage if available
-        if player.current_room in SECRET_PASSAGES:
-            dest = SECRET_PASSAGES[player.current_room]
+        dest = SECRET_PASSAGES.get(cur_room)
+        if dest:
             is_good_dest = dest.value not in rooms_in_hand
-            result += f"\n🔑 SECRET PASSAGE to {dest.value}!"
+            parts.append(f"\n🔑 SECRET PASSAGE to {dest.value}!")
             if is_good_dest:
-                result += " ✅ RECOMMENDED - you don't have this room card!\n"
+                parts.append(" ✅ RECOMMENDED - you don't have this room card!\n")
             else:
-                result += " ⚠️ You have this room card - consider other options.\n"
-            result += "   (Using passage ends your turn immediately)\n"
+                parts.append(" ⚠️ You have this room card - consider other options.\n")
+            parts.append("   (Using passage ends your turn immediately)\n")
         
-        result += f"\n💡 Roll dice first to get movement points, then use 'Move To Room'.\n"
+        parts.append("\n💡 Roll dice first to get movement points, then use 'Move To Room'.\n")
         
     else:
         # In hallway
         if player.position:
-            result += f"📍 Current position: ({player.position[0]}, {player.position[1]}) in hallway\n"
+            parts.append(f"📍 Current position: ({player.position[0]}, {player.position[1]}) in hallway\n")
         else:
-            start_name = STARTING_POSITION_NAMES.get(player.character, "START")
-            result += f"📍 Current position: {start_name}\n"
+            parts.append(f"📍 Current position: {player.start_name}\n")
         
-        result += f"   Moves remaining: {player.moves_remaining}\n\n"
+        parts.append(f"   Moves remaining: {player.moves_remaining}\n\n")
         
         if player.moves_remaining <= 0:
-            result += "⚠️ No moves remaining. Roll dice to get movement points.\n"
+            parts.append("⚠️ No moves remaining. Roll dice to get movement points.\n")
         else:
             # Find reachable rooms
-            reachable = game_state.get_reachable_rooms(player)
+            occupied = game_state.get_occupied_positions(exclude_player=player)
+            reachable = game_state.get_reachable_rooms(player, occupied)
             
             if reachable:
-                # Separate into recommended and not recommended
+                # Separate into recommended and not recommended (room name, distance)
                 recommended = []
                 avoid = []
-                for room, distance, path in reachable:
-                    if room.value in rooms_in_hand:
-                        avoid.append((room, distance, path))
-                    else:
-                        recommended.append((room, distance, path))
+                for room, distance, _ in reachable:
+                    name = room.value
+                    (avoid if name in rooms_in_hand else recommended).append((name, distance))
                 
                 if recommended:
-                    result += "✅ RECOMMENDED ROOMS (you don't have these cards):\n"
-                    for room, distance, path in recommended:
-                        result += f"   • {room.value} - {distance} steps ← BEST CHOICE\n"
+                    parts.append("✅ RECOMMENDED ROOMS (you don't have these cards):\n")
+                    parts.extend(f"   • {name} - {distance} steps ← BEST CHOICE\n" for name, distance in recommended)
                 
                 if avoid:
-                    result += "\n⚠️ AVOID THESE ROOMS (you have the card):\n"
-                    for room, distance, path in avoid:
-                        result += f"   • {room.value} - {distance} steps ← SKIP THIS\n"
+                    parts.append("\n⚠️ AVOID THESE ROOMS (you have the card):\n")
+                    parts.extend(f"   • {name} - {distance} steps ← SKIP THIS\n" for name, distance in avoid)
                 
                 if not recommended and avoid:
-                    result += "\n💡 All reachable rooms are ones you have cards for.\n"
-                    result += "   Consider moving closer to other rooms instead.\n"
+                    parts.append("\n💡 All reachable rooms are ones you have cards for.\n")
+                    parts.append("   Consider moving closer to other rooms instead.\n")
             else:
-                result += "⚠️ No rooms reachable with current moves.\n"
-                result += "   You need to roll more moves or position closer.\n"
+                parts.append("⚠️ No rooms reachable with current moves.\n")
+                parts.append("   You need to roll more moves or position closer.\n")
             
             # Show immediate adjacent moves
-            valid_moves = game_state.get_valid_moves_from_position(player)
+            valid_moves = game_state.get_valid_moves_from_position(player, occupied)
             if valid_moves:
-                result += f"\n🚶 Adjacent squares you can step to:\n"
+                parts.append("\n🚶 Adjacent squares you can step to:\n")
                 for row, col, room in valid_moves[:5]:  # Limit display
                     if room:
                         is_good = room.value not in rooms_in_hand
                         marker = "✅" if is_good else "⚠️"
-                        result += f"   • ({row}, {col}) → Enter {room.value} {marker}\n"
+                        parts.append(f"   • ({row}, {col}) → Enter {room.value} {marker}\n")
                     else:
-                        result += f"   • ({row}, {col}) - hallway\n"
+                        parts.append(f"   • ({row}, {col}) - hallway\n")
     
-    result += "\n⚠️ MOVEMENT RULES:\n"
-    result += "   • No diagonal movement\n"
-    result += "   • Cannot pass through other players\n"
-    result += "   • Entering a room ends movement\n"
-    result += "   • Cannot cross same square twice per turn"
+    parts.append(
+        "\n⚠️ MOVEMENT RULES:\n"
+        "   • No diagonal movement\n"
+        "   • Cannot pass through other players\n"
+        "   • Entering a room ends movement\n"
+        "   • Cannot cross same square twice per turn"
+    )
     
-    return result
+    return "".join(parts)
 
 
 @tool("Move To Room")
@@ -381,29 +443,25 @@ def move_to_room(player_name: str, room_name: str) -> str:
     Returns:
         Confirmation of movement or error message
     """
-    game_state = get_game_state()
-    player = game_state.get_player_by_name(player_name)
-    
-    if not player:
-        return f"Error: Player {player_name} not found"
+    game_state, player, error = _get_player(player_name)
+    if error:
+        return error
     
     # Find the room enum
-    target_room = None
-    for room in Room:
-        if room.value.lower() == room_name.lower():
-            target_room = room
-            break
+    target_room, error = _resolve(room_name, _ROOM_BY_LOWER, "room", _VALID_ROOM_NAMES)
+    if error:
+        return error
     
-    if not target_room:
-        valid_rooms = [r.value for r in Room]
-        return f"Error: Invalid room '{room_name}'. Valid rooms: {', '.join(valid_rooms)}"
+    # Other players' squares, looked up once and shared by the door and path checks
+    occupied = None
     
     # Get current location description
-    if player.current_room and not player.in_hallway:
-        current_location = player.current_room.value
+    cur_room = player.current_room
+    if cur_room and not player.in_hallway:
+        current_location = cur_room.value
         
         # Check if using secret passage
-        if player.current_room in SECRET_PASSAGES and SECRET_PASSAGES[player.current_room] == target_room:
+        if SECRET_PASSAGES.get(cur_room) is target_room:
             success, msg = game_state.use_secret_passage(player)
             if success:
                 sys.stdout.write(f"    🔑 {player_name} used SECRET PASSAGE: {current_location} → {target_room.value}\n")
@@ -412,33 +470,34 @@ def move_to_room(player_name: str, room_name: str) -> str:
             else:
                 return f"❌ {msg}"
         
+        # Rule out rooms too far for any exit before leaving this one. Leaving
+        # costs a move, and the table ignores other players, so it never
+        # rejects a room the path search could reach.
+        moves = player.moves_remaining
+        if moves > 0 and target_room is not cur_room:
+            min_steps = game_state.min_steps_between_rooms(cur_room, target_room)
+            if min_steps is None or min_steps >= moves:
+                return (f"❌ Cannot reach {target_room.value} with {moves} moves remaining.\n\n"
+                        f"It is more than {moves} steps from {current_location}, "
+                        f"so you stay in {current_location}.")
+        
         # Need to exit room first - find available doors
-        doors = game_state.get_room_doors(player.current_room)
+        doors = game_state.get_room_doors(cur_room)
         
         if not doors:
             return f"❌ Cannot find exit from {current_location}"
         
-        # Try each door to find path to target room
-        best_door = None
-        min_distance = float('inf')
-        
         occupied = game_state.get_occupied_positions(exclude_player=player)
         
-        for door_pos in doors:
-            if door_pos in occupied:
-                continue  # Door blocked
-            
-            # Temporarily exit through this door and check if target is reachable
-            # We'll pick the door that gives shortest path
-            # For now, just use the first unblocked door
-            best_door = door_pos
-            break
+        # Use the first door not blocked by another player. Picking the door
+        # with the shortest onward path would mean a BFS per door.
+        best_door = next((d for d in doors if d not in occupied), None)
         
-        if not best_door:
+        if best_door is None:
             return f"❌ All exits from {current_location} are blocked by other players"
         
         # Exit through the door
-        if not game_state.exit_room_to_hallway(player, best_door):
+        if not game_state.exit_room_to_hallway(player, best_door, occupied):
             return f"❌ Could not exit {current_location}"
         
         sys.stdout.write(f"    🚶 {player_name} exited {current_location} to hallway\n")
@@ -448,38 +507,33 @@ def move_to_room(player_name: str, room_name: str) -> str:
         return f"❌ No moves remaining. You need to roll dice first or you've used all your moves."
     
     # Check if target room is reachable
-    reachable = game_state.get_reachable_rooms(player)
-    target_reachable = None
-    
-    for room, distance, path in reachable:
-        if room == target_room:
-            target_reachable = (room, distance, path)
-            break
+    reachable = game_state.get_reachable_rooms(player, occupied)
+    # Enum members are singletons, so identity is enough to match the target
+    target_reachable = next((entry for entry in reachable if entry[0] is target_room), None)
     
     if not target_reachable:
         # List what IS reachable
         if reachable:
-            reachable_names = [f"{r.value} ({d} steps)" for r, d, p in reachable]
+            body = "\n".join(f"  • {r.value} ({d} steps)" for r, d, _ in reachable)
             return (f"❌ Cannot reach {target_room.value} with {player.moves_remaining} moves remaining.\n\n"
-                    f"Rooms you CAN reach:\n" + "\n".join(f"  • {n}" for n in reachable_names))
+                    f"Rooms you CAN reach:\n{body}")
         else:
             return (f"❌ Cannot reach any room with {player.moves_remaining} moves remaining.\n"
                     f"You may need to move closer in the hallway first.")
     
     room, distance, path = target_reachable
     
-    # Execute the movement along the path
+    # Execute the movement along the path (already validated by the BFS)
     start_pos = player.position
-    for i, (row, col) in enumerate(path[1:], 1):  # Skip first position (current)
-        success, entered_room, msg = game_state.move_player_one_step(player, row, col)
-        if not success:
-            return f"❌ Movement blocked at step {i}: {msg}"
-        
-        if entered_room:
-            # Entered the room!
-            sys.stdout.write(f"    🚶 {player_name} moved: ({start_pos[0]},{start_pos[1]}) → {entered_room.value} ({distance} steps)\n")
-            sys.stdout.flush()
-            return f"✓ Moved to {entered_room.value} in {distance} steps.\n\nYou can now make a suggestion about this room."
+    success, entered_room, msg = game_state.execute_validated_path(player, path)
+    if not success:
+        return f"❌ Movement blocked: {msg}"
+    
+    if entered_room:
+        # Entered the room!
+        sys.stdout.write(f"    🚶 {player_name} moved: ({start_pos[0]},{start_pos[1]}) → {entered_room.value} ({distance} steps)\n")
+        sys.stdout.flush()
+        return f"✓ Moved to {entered_room.value} in {distance} steps.\n\nYou can now make a suggestion about this room."
     
     # Should have entered room by end of path
     sys.stdout.write(f"    🚶 {player_name} moved {distance} steps toward {target_room.value}\n")
@@ -513,84 +567,69 @@ def make_suggestion(player_name: str, suspect: str, weapon: str) -> str:
     Returns:
         Result of the suggestion including if anyone disproved it
     """
-    game_state = get_game_state()
-    player = game_state.get_player_by_name(player_name)
-    
-    if not player:
-        return f"Error: Player {player_name} not found"
+    game_state, player, error = _get_player(player_name)
+    if error:
+        return error
     
-    if not player.current_room:
+    cur_room = player.current_room
+    if not cur_room:
         return "Error: You must be in a room to make a suggestion. Roll the dice and move to a room first."
     
     # Check if player entered a room this turn
     if not player.entered_room_this_turn and not player.was_moved_by_suggestion:
         return "Error: You must ENTER a room during your turn to make a suggestion. You are currently in a room but did not enter it this turn. You need to leave and re-enter a room, or use your dice roll to move to a different room."
     
-    # Validate suspect
-    valid_suspect = None
-    for s in Suspect:
-        if s.value.lower() == suspect.lower():
-            valid_suspect = s.value
-            break
+    # Validate suspect and weapon
+    suspect_enum, error = _resolve(suspect, _SUSPECT_BY_LOWER, "suspect", _VALID_SUSPECT_NAMES)
+    if error:
+        return error
+    weapon_enum, error = _resolve(weapon, _WEAPON_BY_LOWER, "weapon", _VALID_WEAPON_NAMES)
+    if error:
+        return error
+    valid_suspect = suspect_enum.value
+    valid_weapon = weapon_enum.value
     
-    if not valid_suspect:
-        valid = [s.value for s in Suspect]
-        return f"Error: Invalid suspect '{suspect}'. Valid suspects: {', '.join(valid)}"
-    
-    # Validate weapon
-    valid_weapon = None
-    for w in Weapon:
-        if w.value.lower() == weapon.lower():
-            valid_weapon = w.value
-            break
-    
-    if not valid_weapon:
-        valid = [w.value for w in Weapon]
-        return f"Error: Invalid weapon '{weapon}'. Valid weapons: {', '.join(valid)}"
-    
-    current_room = player.current_room.value
+    current_room = cur_room.value
     
     # Check the notebook to validate the suggestion is strategic
-    notebook_warning = ""
+    warning_parts = []  # Spliced into the reply; stays empty unless the notebook objects
     is_wasted = False
     wasted_reason = ""
-    try:
-        notebook = get_notebook(player_name)
+    # If the player has no notebook yet, proceed without warning
+    notebook = find_notebook(player_name)
+    if notebook is not None:
         validation = notebook.validate_suggestion(valid_suspect, valid_weapon, current_room)
         
         if not validation["valid"]:
             # Warn the agent but allow the suggestion (unlike accusation which blocks)
-            warning_msg = "\n".join(validation["warnings"])
-            notebook_warning = f"\n⚠️ NOTEBOOK WARNING:\n{warning_msg}\n"
+            warning_parts.append("\n⚠️ NOTEBOOK WARNING:\n")
+            warning_parts.extend(w + "\n" for w in validation["warnings"])
             is_wasted = True
             wasted_reason = f"Suggested cards already known: {', '.join(validation.get('wasted_cards', []))}"
             
             # Suggest better alternatives
-            if validation.get("better_suspects"):
-                notebook_warning += f"\n📋 Better suspects to suggest: {', '.join(validation['better_suspects'][:3])}"
-            if validation.get("better_weapons"):
-                notebook_warning += f"\n📋 Better weapons to suggest: {', '.join(validation['better_weapons'][:3])}"
-            notebook_warning += "\n"
-    except Exception:
-        # If notebook doesn't exist yet, proceed without warning
-        pass
+            better_suspects = validation.get("better_suspects")
+            if better_suspects:
+                warning_parts.append(f"\n📋 Better suspects to suggest: {', '.join(better_suspects[:3])}")
+            better_weapons = validation.get("better_weapons")
+            if better_weapons:
+                warning_parts.append(f"\n📋 Better weapons to suggest: {', '.join(better_weapons[:3])}")
+            warning_parts.append("\n")
     
     try:
         suggestion = game_state.make_suggestion(player, valid_suspect, valid_weapon)
     except ValueError as e:
         return f"Error: {str(e)}"
     
-    # Print suggestion to console
-    sys.stdout.write(f"\n    📣 SUGGESTION: {player_name} suggests {valid_suspect} with the {valid_weapon} in the {suggestion.room}\n")
+    # Console announcement; the outcome line is appended and both are written together
+    console_line = f"\n    📣 SUGGESTION: {player_name} suggests {valid_suspect} with the {valid_weapon} in the {suggestion.room}\n"
     
-    result = f"📣 SUGGESTION: {valid_suspect} with the {valid_weapon} in the {suggestion.room}\n"
-    result += f"   (The {valid_suspect} token has been moved to the {suggestion.room})\n"
-    
-    # Add notebook warning if any
-    if notebook_warning:
-        result += notebook_warning
-    
-    result += "\n"
+    parts = [
+        f"📣 SUGGESTION: {valid_suspect} with the {valid_weapon} in the {suggestion.room}\n",
+        f"   (The {valid_suspect} token has been moved to the {suggestion.room})\n",
+        *warning_parts,
+        "\n",
+    ]
     
     # Track suggestion quality for validation metrics
     from clue_game.tools.validation_tools import track_suggestion_quality
@@ -600,23 +639,22 @@ def make_suggestion(player_name: str, suspect: str, weapon: str) -> str:
         pass  # Don't fail if tracking fails
     
     if suggestion.disproven_by:
-        result += f"❌ DISPROVEN by {suggestion.disproven_by} who showed you: {suggestion.card_shown}\n"
-        result += f"   This means {suggestion.card_shown} is NOT part of the solution.\n"
-        result += f"   📝 All players' notebooks have been auto-updated!"
-        sys.stdout.write(f"    ❌ Disproven by {suggestion.disproven_by} (showed: {suggestion.card_shown})\n")
+        parts.append(f"❌ DISPROVEN by {suggestion.disproven_by} who showed you: {suggestion.card_shown}\n")
+        parts.append(f"   This means {suggestion.card_shown} is NOT part of the solution.\n")
+        parts.append("   📝 All players' notebooks have been auto-updated!")
+        sys.stdout.write(f"{console_line}    ❌ Disproven by {suggestion.disproven_by} (showed: {suggestion.card_shown})\n")
         sys.stdout.flush()
         # Update player knowledge
-        if suggestion.card_shown not in player.knowledge["seen_cards"]:
-            player.knowledge["seen_cards"].append(suggestion.card_shown)
+        player.knowledge["seen_cards"].add(suggestion.card_shown)
         # Update ALL players' notebooks with this information
         update_all_notebooks_card_shown(suggestion.card_shown, suggestion.disproven_by)
     else:
-        result += "✓ NO ONE could disprove this suggestion!\n"
-        result += "  This is a VERY strong lead - consider making an accusation!"
-        sys.stdout.write(f"    ✓ NO ONE could disprove!\n")
+        parts.append("✓ NO ONE could disprove this suggestion!\n")
+        parts.append("  This is a VERY strong lead - consider making an accusation!")
+        sys.stdout.write(f"{console_line}    ✓ NO ONE could disprove!\n")
         sys.stdout.flush()
     
-    return result
+    return "".join(parts)
 
 
 @tool("Make Accusation")
@@ -644,42 +682,30 @@ def make_accusation(player_name: str, suspect: str, weapon: str, room: str) -> s
     Returns:
         Whether you won or were eliminated
     """
-    game_state = get_game_state()
-    player = game_state.get_player_by_name(player_name)
-    
-    if not player:
-        return f"Error: Player {player_name} not found"
+    game_state, player, error = _get_player(player_name)
+    if error:
+        return error
     
     if not player.is_active:
         return "Error: You have been eliminated and cannot make accusations (but you must still show cards to disprove suggestions)"
     
-    # Validate inputs
-    valid_suspect = None
-    for s in Suspect:
-        if s.value.lower() == suspect.lower():
-            valid_suspect = s.value
-            break
-    
-    valid_weapon = None
-    for w in Weapon:
-        if w.value.lower() == weapon.lower():
-            valid_weapon = w.value
-            break
-    
-    valid_room = None
-    for r in Room:
-        if r.value.lower() == room.lower():
-            valid_room = r.value
-            break
-    
-    if not all([valid_suspect, valid_weapon, valid_room]):
+    # Validate inputs (one combined error, so _resolve's per-kind messages aren't used)
+    suspect_enum = _SUSPECT_BY_LOWER.get(suspect.lower())
+    weapon_enum = _WEAPON_BY_LOWER.get(weapon.lower())
+    room_enum = _ROOM_BY_LOWER.get(room.lower())
+    
+    if None in (suspect_enum, weapon_enum, room_enum):
         return "Error: Invalid suspect, weapon, or room name"
+    valid_suspect = suspect_enum.value
+    valid_weapon = weapon_enum.value
+    valid_room = room_enum.value
     
     # Check the notebook to validate the accusation
     validation_failed = False
     validation_warnings = []
-    try:
-        notebook = get_notebook(player_name)
+    # If the player has no notebook yet, allow the accusation unchecked
+    notebook = find_notebook(player_name)
+    if notebook is not None:
         validation = notebook.validate_accusation(valid_suspect, valid_weapon, valid_room)
         
         if not validation["valid"]:
@@ -687,8 +713,12 @@ def make_accusation(player_name: str, suspect: str, weapon: str, room: str) -> s
             validation_failed = True
             validation_warnings = validation["warnings"]
             warning_msg = "\n".join(validation["warnings"])
-            result = f"🛑 ACCUSATION BLOCKED!\n\n"
-            result += f"Your notebook shows this accusation cannot be correct:\n{warning_msg}\n\n"
+            parts = [
+                "🛑 ACCUSATION BLOCKED!\n\n",
+                "Your notebook shows this accusation cannot be correct:\n",
+                warning_msg,
+                "\n\n",
+            ]
             
             # Log this as an invalid attempt
             from clue_game.tools.validation_tools import log_validation_warning
@@ -705,15 +735,12 @@ def make_accusation(player_name: str, suspect: str, weapon: str, room: str) -> s
             # Show recommendation if available
             rec = validation["recommendation"]
             if rec["can_accuse"]:
-                result += f"📋 Your notebook suggests: {rec['suspect']} with {rec['weapon']} in {rec['room']}\n"
+                parts.append(f"📋 Your notebook suggests: {rec['suspect']} with {rec['weapon']} in {rec['room']}\n")
             else:
-                result += f"📋 You need more information before accusing.\n"
-                result += f"   Reason: {rec['reason']}\n"
+                parts.append("📋 You need more information before accusing.\n")
+                parts.append(f"   Reason: {rec['reason']}\n")
             
-            return result
-    except Exception:
-        # If notebook doesn't exist yet, allow the accusation (agent hasn't initialized notebook)
-        pass
+            return "".join(parts)
     
     try:
         is_correct = game_state.make_accusation(player, valid_suspect, valid_weapon, valid_room)
@@ -721,13 +748,17 @@ def make_accusation(player_name: str, suspect: str, weapon: str, room: str) -> s
         return f"⚠️ {str(e)}"
     
     if is_correct:
-        sys.stdout.write(f"\n    🎉 ACCUSATION CORRECT! {player_name} WINS!\n")
-        sys.stdout.write(f"    🔍 Solution: {valid_suspect} with the {valid_weapon} in the {valid_room}\n")
+        sys.stdout.write(
+            f"\n    🎉 ACCUSATION CORRECT! {player_name} WINS!\n"
+            f"    🔍 Solution: {valid_suspect} with the {valid_weapon} in the {valid_room}\n"
+        )
         sys.stdout.flush()
         return f"🎉 CORRECT! {player_name} WINS! The solution was {valid_suspect} with the {valid_weapon} in the {valid_room}!"
     else:
-        sys.stdout.write(f"\n    ❌ WRONG ACCUSATION! {player_name} is eliminated!\n")
-        sys.stdout.write(f"    ❌ Accused: {valid_suspect} with the {valid_weapon} in the {valid_room}\n")
+        sys.stdout.write(
+            f"\n    ❌ WRONG ACCUSATION! {player_name} is eliminated!\n"
+            f"    ❌ Accused: {valid_suspect} with the {valid_weapon} in the {valid_room}\n"
+        )
         sys.stdout.flush()
         return f"❌ WRONG! {player_name} is eliminated. The accusation of {valid_suspect} with the {valid_weapon} in the {valid_room} was incorrect."
 
@@ -758,15 +789,15 @@ def get_suggestion_history() -> str:
     if not game_state.suggestion_history:
         return "No suggestions have been made yet."
     
-    result = "=== Suggestion History ===\n"
+    parts = ["=== Suggestion History ===\n"]
     for i, sugg in enumerate(game_state.suggestion_history, 1):
-        result += f"\n{i}. {sugg.suggester} suggested: {sugg.suspect} with {sugg.weapon} in {sugg.room}"
+        parts.append(f"\n{i}. {sugg.suggester} suggested: {sugg.suspect} with {sugg.weapon} in {sugg.room}")
         if sugg.disproven_by:
-            result += f"\n   Disproven by: {sugg.disproven_by}"
+            parts.append(f"\n   Disproven by: {sugg.disproven_by}")
         else:
-            result += "\n   NOT DISPROVEN"
+            parts.append("\n   NOT DISPROVEN")
     
-    return result
+    return "".join(parts)
 
 
 @tool("Get My Knowledge")
@@ -780,54 +811,32 @@ def get_my_knowledge(player_name: str) -> str:
     Returns:
         Summary of your deductions
     """
-    game_state = get_game_state()
-    player = game_state.get_player_by_name(player_name)
-    
-    if not player:
-        return f"Error: Player {player_name} not found"
-    
-    result = "=== Your Knowledge ===\n\n"
+    game_state, player, error = _get_player(player_name)
+    if error:
+        return error
     
     # Cards you hold (definitely not the solution)
-    result += "Cards in your hand (NOT the solution):\n"
-    for card in player.cards:
-        result += f"  - {card.name} ({card.card_type})\n"
+    parts = ["=== Your Knowledge ===\n\n", "Cards in your hand (NOT the solution):\n"]
+    parts.extend(f"  - {card.name} ({card.card_type})\n" for card in player.cards)
     
     # Cards shown to you (also not the solution)
-    if player.knowledge["seen_cards"]:
-        result += "\nCards shown to you by others (NOT the solution):\n"
-        for card_name in player.knowledge["seen_cards"]:
-            result += f"  - {card_name}\n"
+    seen_cards = player.knowledge["seen_cards"]
+    if seen_cards:
+        parts.append("\nCards shown to you by others (NOT the solution):\n")
+        parts.extend(f"  - {card_name}\n" for card_name in sorted(seen_cards))
     
     # All suspects, weapons, rooms for reference
-    result += "\n--- All Possibilities ---\n"
-    
-    eliminated = set([c.name for c in player.cards] + player.knowledge["seen_cards"])
+    parts.append("\n--- All Possibilities ---\n")
     
-    result += "\nSuspects: "
-    for s in Suspect:
-        if s.value in eliminated:
-            result += f"[{s.value}] "
-        else:
-            result += f"{s.value}, "
-    
-    result += "\n\nWeapons: "
-    for w in Weapon:
-        if w.value in eliminated:
-            result += f"[{w.value}] "
-        else:
-            result += f"{w.value}, "
+    eliminated = {c.name for c in player.cards} | seen_cards
     
-    result += "\n\nRooms: "
-    for r in Room:
-        if r.value in eliminated:
-            result += f"[{r.value}] "
-        else:
-            result += f"{r.value}, "
+    for heading, cells in _KNOWLEDGE_SECTIONS:
+        parts.append(heading)
+        parts.extend(crossed if name in eliminated else open_ for name, crossed, open_ in cells)
     
-    result += "\n\n(Items in [brackets] have been eliminated)"
+    parts.append("\n\n(Items in [brackets] have been eliminated)")
     
-    return result
+    return "".join(parts)
 
 
 @tool("Get Valid Options")
@@ -838,15 +847,4 @@ def get_valid_options() -> str:
     Returns:
         Lists of all valid options
     """
-    suspects = [s.value for s in Suspect]
-    weapons = [w.value for w in Weapon]
-    rooms = [r.value for r in Room]
-    
-    return f"""Valid Options:
-
-SUSPECTS: {', '.join(suspects)}
-
-WEAPONS: {', '.join(weapons)}
-
-ROOMS: {', '.join(rooms)}
-"""
+    return _VALID_OPTIONS
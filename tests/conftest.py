@@ -0,0 +1,44 @@
+"""
+Shared fixtures for the Clue game tests.
+"""
+
+import os
+import pickle
+
+import pytest
+
+# Keep crewai from sending traces during tests. conftest.py is imported before
+# any test module, so this is set before crewai is first loaded.
+os.environ["CREWAI_TRACING_ENABLED"] = "false"
+
+from clue_game import game_state as game_state_module
+from clue_game.game_state import GameState
+
+
+@pytest.fixture(scope="session")
+def baseline_games():
+    """Pickled set-up games, dealt once per session for each list of player names."""
+    return {}
+
+
+@pytest.fixture
+def fresh_game(baseline_games, monkeypatch):
+    """
+    Factory returning a freshly dealt GameState for the given player names.
+
+    setup_game runs once per session per name list; each call hands back an
+    independent copy of that deal, so tests can mutate it freely. The copy
+    is also installed as the global game state, so tools see it too.
+    """
+    def make(player_names: list[str]) -> GameState:
+        key = tuple(player_names)
+        blob = baseline_games.get(key)
+        if blob is None:
+            game = GameState()
+            game.setup_game(list(player_names))
+            blob = baseline_games[key] = pickle.dumps(game)
+        game = pickle.loads(blob)
+        monkeypatch.setattr(game_state_module, "_game_state", game)
+        return game
+
+    return make
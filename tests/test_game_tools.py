@@ -6,12 +6,16 @@ Note: CrewAI @tool decorated functions return Tool objects.
 To call them directly in tests, we use .func() to get the underlying function.
 """
 
+import re
+
 import pytest
 from clue_game.game_state import (
     reset_game_state,
+    Card,
     Room,
     Suspect,
     Weapon,
+    STARTING_POSITION_NAMES,
 )
 from clue_game.tools.game_tools import (
     get_my_cards,
@@ -27,187 +31,230 @@ from clue_game.tools.game_tools import (
     get_valid_options,
 )
 
+# Underlying functions of the @tool objects, resolved once
+_get_my_cards = get_my_cards.func
+_get_current_location = get_current_location.func
+_get_available_moves = get_available_moves.func
+_roll_dice = roll_dice.func
+_move_to_room = move_to_room.func
+_make_suggestion = make_suggestion.func
+_make_accusation = make_accusation.func
+_get_game_status = get_game_status.func
+_get_suggestion_history = get_suggestion_history.func
+_get_my_knowledge = get_my_knowledge.func
+_get_valid_options = get_valid_options.func
+
+# Accepted phrasings for tool replies; (?i:...) marks the case-insensitive words
+_MOVE_OPTIONS = re.compile(r"REACHABLE ROOMS|Study|(?i:door)")
+_EXIT_OPTIONS = re.compile(r"SECRET PASSAGE|Study|(?i:door)")
+_ROOM_CARD_WARNING = re.compile(r"STRATEGIC|AVOID|WARNING")
+_ROOM_CARD_ADVICE = re.compile(r"STRATEGIC|AVOID|(?i:hold)")
+_MOVE_SUCCEEDED = re.compile(r"✓|Study|(?i:moved)")
+_MOVE_REFUSED = re.compile(r"Cannot|❌|No path|(?i:not reachable)")
+_ACCUSATION_WON = re.compile(r"CORRECT|WINS|🎉")
+_ACCUSATION_LOST = re.compile(r"WRONG|❌|(?i:eliminated)")
+
+
+@pytest.fixture
+def setup_players(fresh_game):
+    """A fresh two-player game with handles on both players: (game, TestPlayer, Other)."""
+    game = fresh_game(["TestPlayer", "Other"])
+    return game, game.get_player_by_name("TestPlayer"), game.get_player_by_name("Other")
+
+
+@pytest.fixture
+def player_in_library(setup_players):
+    """(game, TestPlayer) with TestPlayer having just entered the Library, ready to suggest."""
+    game, player, _ = setup_players
+    player.current_room = Room.LIBRARY
+    player.in_hallway = False
+    player.entered_room_this_turn = True
+    return game, player
+
+
+def assert_contains_all(text, *needles):
+    """Assert every needle appears in text, reporting all that are missing at once."""
+    missing = [needle for needle in needles if needle not in text]
+    assert not missing, f"missing {missing} in:\n{text}"
+
 
 class TestGetMyCards:
     """Test the Get My Cards tool."""
     
-    def test_returns_player_cards(self):
+    def test_returns_player_cards(self, fresh_game):
         """Should return the cards in player's hand."""
-        game = reset_game_state()
-        game.setup_game(["TestPlayer", "Other"])
+        game = fresh_game(["TestPlayer", "Other"])
         
-        result = get_my_cards.func(player_name="TestPlayer")
+        result = _get_my_cards(player_name="TestPlayer")
         
-        assert "Your cards" in result
-        assert "total" in result
+        assert_contains_all(result, "Your cards", "total")
     
     def test_error_for_unknown_player(self):
         """Should return error for unknown player."""
         reset_game_state()
-        result = get_my_cards.func(player_name="NonExistent")
+        result = _get_my_cards(player_name="NonExistent")
         assert "Error" in result
 
 
 class TestGetCurrentLocation:
     """Test the Get Current Location tool."""
     
-    def test_returns_room(self):
+    def test_returns_room(self, setup_players):
         """Should return player's current room."""
-        game = reset_game_state()
-        game.setup_game(["TestPlayer", "Other"])
-        player = game.get_player_by_name("TestPlayer")
+        game, player, _ = setup_players
         player.current_room = Room.LIBRARY
         player.in_hallway = False
         
-        result = get_current_location.func(player_name="TestPlayer")
+        result = _get_current_location(player_name="TestPlayer")
         
         assert "Library" in result
     
-    def test_shows_moved_by_suggestion(self):
+    def test_shows_moved_by_suggestion(self, setup_players):
         """Should indicate if player was moved by suggestion."""
-        game = reset_game_state()
-        game.setup_game(["TestPlayer", "Other"])
-        player = game.get_player_by_name("TestPlayer")
+        game, player, _ = setup_players
         player.current_room = Room.LIBRARY
         player.in_hallway = False
         player.was_moved_by_suggestion = True
         
-        result = get_current_location.func(player_name="TestPlayer")
+        result = _get_current_location(player_name="TestPlayer")
         
         assert "moved" in result.lower() or "suggestion" in result.lower()
+    
+    def test_names_start_square_without_grid_position(self, setup_players):
+        """A player off the grid should see their character's START square name."""
+        game, player, _ = setup_players
+        player.position = None
+        
+        result = _get_current_location(player_name="TestPlayer")
+        
+        assert STARTING_POSITION_NAMES[player.character] in result
 
 
 class TestRollDice:
     """Test the Roll Dice tool."""
     
-    def test_returns_dice_values(self):
+    def test_returns_dice_values(self, fresh_game):
         """Should return dice roll results."""
-        game = reset_game_state()
-        game.setup_game(["TestPlayer", "Other"])
+        game = fresh_game(["TestPlayer", "Other"])
         
-        result = roll_dice.func(player_name="TestPlayer")
+        result = _roll_dice(player_name="TestPlayer")
         
         assert "DICE ROLL" in result
         assert "+" in result  # Shows die1 + die2
     
-    def test_magnifying_glass_counts_as_one(self):
+    def test_magnifying_glass_counts_as_one(self, fresh_game, monkeypatch):
         """Magnifying glass (1 on die) should count as 1 for movement total."""
-        import unittest.mock as mock
-        
-        game = reset_game_state()
-        game.setup_game(["TestPlayer", "Other"])
+        game = fresh_game(["TestPlayer", "Other"])
         
-        # Mock roll_dice to return a magnifying glass (1) on first die
-        with mock.patch.object(game, 'roll_dice', return_value=(1, 4, 1)):
-            result = roll_dice.func(player_name="TestPlayer")
+        # Fix the roll to a magnifying glass (1) on first die
+        monkeypatch.setattr(game, "roll_dice", lambda: (1, 4, 1))
+        result = _roll_dice(player_name="TestPlayer")
         
         # Should show magnifying glass emoji for die showing 1
         assert "🔍" in result
         # Total movement should be 1 + 4 = 5
         assert "5 movement spaces" in result
     
-    def test_double_magnifying_glass(self):
+    def test_double_magnifying_glass(self, fresh_game, monkeypatch):
         """Both dice showing magnifying glass should give 2 movement spaces."""
-        import unittest.mock as mock
+        game = fresh_game(["TestPlayer", "Other"])
         
-        game = reset_game_state()
-        game.setup_game(["TestPlayer", "Other"])
-        
-        # Mock roll_dice to return magnifying glass on both dice
-        with mock.patch.object(game, 'roll_dice', return_value=(1, 1, 2)):
-            result = roll_dice.func(player_name="TestPlayer")
+        # Fix the roll to a magnifying glass on both dice
+        monkeypatch.setattr(game, "roll_dice", lambda: (1, 1, 2))
+        result = _roll_dice(player_name="TestPlayer")
         
         # Total movement should be 1 + 1 = 2
         assert "2 movement spaces" in result
         # Should mention magnifying glass bonus
         assert "MAGNIFYING GLASS" in result
     
-    def test_shows_available_moves(self):
+    def test_shows_available_moves(self, setup_players):
         """Should show rooms player can move to after rolling dice."""
-        game = reset_game_state()
-        game.setup_game(["TestPlayer", "Other"])
-        player = game.get_player_by_name("TestPlayer")
+        game, player, _ = setup_players
         player.current_room = Room.KITCHEN
         player.in_hallway = False
         
-        result = roll_dice.func(player_name="TestPlayer")
+        result = _roll_dice(player_name="TestPlayer")
         
         # With the grid system, result shows reachable rooms based on dice roll
         # Should mention the turn started and available options
         assert "DICE ROLL" in result
         # Kitchen has secret passage to Study and doors to exit
-        assert "REACHABLE ROOMS" in result or "Study" in result or "door" in result.lower()
+        assert _MOVE_OPTIONS.search(result)
 
 
 class TestGetAvailableMoves:
     """Test the Get Available Moves tool."""
     
-    def test_lists_adjacent_rooms(self):
+    def test_lists_adjacent_rooms(self, setup_players):
         """Should list doors and options when in a room."""
-        game = reset_game_state()
-        game.setup_game(["TestPlayer", "Other"])
-        player = game.get_player_by_name("TestPlayer")
+        game, player, _ = setup_players
         player.current_room = Room.KITCHEN
         player.in_hallway = False
         
-        result = get_available_moves.func(player_name="TestPlayer")
+        result = _get_available_moves(player_name="TestPlayer")
         
         # In the new grid system, when in a room, shows doors and passages
         # Kitchen has doors and a secret passage to Study
-        assert "door" in result.lower() or "Study" in result or "SECRET PASSAGE" in result
+        assert _EXIT_OPTIONS.search(result)
     
-    def test_indicates_secret_passages(self):
+    def test_indicates_secret_passages(self, setup_players):
         """Should mark secret passages."""
-        game = reset_game_state()
-        game.setup_game(["TestPlayer", "Other"])
-        player = game.get_player_by_name("TestPlayer")
+        game, player, _ = setup_players
         player.current_room = Room.KITCHEN
         player.in_hallway = False
         
-        result = get_available_moves.func(player_name="TestPlayer")
+        result = _get_available_moves(player_name="TestPlayer")
         
-        assert "SECRET PASSAGE" in result
-        assert "Study" in result
+        assert_contains_all(result, "SECRET PASSAGE", "Study")
     
-    def test_no_diagonal_warning(self):
+    def test_marks_blocked_doors(self, setup_players):
+        """A door square held by another player should be shown as blocked."""
+        game, player, _ = setup_players
+        player.current_room = Room.BALLROOM
+        player.in_hallway = False
+        blocked_door, open_door = game.get_room_doors(Room.BALLROOM)
+        other = game.get_player_by_name("Other")
+        other.current_room = None
+        other.in_hallway = True
+        other.position = blocked_door
+        
+        result = _get_available_moves(player_name="TestPlayer")
+        
+        assert f"({blocked_door[0]}, {blocked_door[1]}) - BLOCKED" in result
+        assert f"({open_door[0]}, {open_door[1]}) - Available" in result
+    
+    def test_no_diagonal_warning(self, setup_players):
         """Should warn about no diagonal movement."""
-        game = reset_game_state()
-        game.setup_game(["TestPlayer", "Other"])
-        player = game.get_player_by_name("TestPlayer")
+        game, player, _ = setup_players
         player.current_room = Room.HALL
         player.in_hallway = False
         
-        result = get_available_moves.func(player_name="TestPlayer")
+        result = _get_available_moves(player_name="TestPlayer")
         
         assert "diagonal" in result.lower() or "doorway" in result.lower()
     
-    def test_warns_about_rooms_in_hand(self):
+    def test_warns_about_rooms_in_hand(self, setup_players):
         """Should warn player about rooms they hold cards for."""
-        game = reset_game_state()
-        game.setup_game(["TestPlayer", "Other"])
-        player = game.get_player_by_name("TestPlayer")
+        game, player, _ = setup_players
         
         # Give player a room card
-        from clue_game.game_state import Card
         player.cards = [Card("Kitchen", "room")]
         
         player.current_room = Room.KITCHEN
         player.in_hallway = False
         
-        result = get_available_moves.func(player_name="TestPlayer")
+        result = _get_available_moves(player_name="TestPlayer")
         
         # Should show strategic advice about avoiding this room
         assert "Kitchen" in result
-        assert "STRATEGIC" in result or "AVOID" in result or "WARNING" in result
+        assert _ROOM_CARD_WARNING.search(result)
     
-    def test_recommends_rooms_not_in_hand(self):
+    def test_recommends_rooms_not_in_hand(self, setup_players):
         """Should recommend rooms player doesn't have cards for."""
-        game = reset_game_state()
-        game.setup_game(["TestPlayer", "Other"])
-        player = game.get_player_by_name("TestPlayer")
+        game, player, _ = setup_players
         
         # Give player a room card for Kitchen only
-        from clue_game.game_state import Card
         player.cards = [Card("Kitchen", "room")]
         
         # Put player in hallway with moves
@@ -216,73 +263,67 @@ class TestGetAvailableMoves:
         player.position = (12, 5)  # Near multiple rooms
         player.moves_remaining = 10
         
-        result = get_available_moves.func(player_name="TestPlayer")
+        result = _get_available_moves(player_name="TestPlayer")
         
         # Should show strategic advice
-        assert "STRATEGIC" in result or "AVOID" in result or "hold" in result.lower()
+        assert _ROOM_CARD_ADVICE.search(result)
     
-    def test_secret_passage_recommendation(self):
+    def test_secret_passage_recommendation(self, setup_players):
         """Should indicate if secret passage leads to good/bad room."""
-        game = reset_game_state()
-        game.setup_game(["TestPlayer", "Other"])
-        player = game.get_player_by_name("TestPlayer")
+        game, player, _ = setup_players
         
         # Give player the Study card
-        from clue_game.game_state import Card
         player.cards = [Card("Study", "room")]
         
         # Put player in Kitchen (which has passage to Study)
         player.current_room = Room.KITCHEN
         player.in_hallway = False
         
-        result = get_available_moves.func(player_name="TestPlayer")
+        result = _get_available_moves(player_name="TestPlayer")
         
         # Should show secret passage with warning since they have Study card
-        assert "SECRET PASSAGE" in result
-        assert "Study" in result
+        assert_contains_all(result, "SECRET PASSAGE", "Study")
 
 
 class TestMoveToRoom:
     """Test the Move To Room tool."""
     
-    def test_successful_move(self):
+    def test_successful_move(self, setup_players):
         """Should move player to adjacent room via secret passage."""
-        game = reset_game_state()
-        game.setup_game(["TestPlayer", "Other"])
-        player = game.get_player_by_name("TestPlayer")
+        game, player, _ = setup_players
         player.current_room = Room.KITCHEN
         player.in_hallway = False
         # Set moves remaining for the turn (simulates rolling dice)
         player.moves_remaining = 6
         
         # Use secret passage from Kitchen to Study (doesn't require dice roll steps)
-        result = move_to_room.func(player_name="TestPlayer", room_name="Study")
+        result = _move_to_room(player_name="TestPlayer", room_name="Study")
         
-        assert "moved" in result.lower() or "✓" in result or "Study" in result
+        assert _MOVE_SUCCEEDED.search(result)
         assert player.current_room == Room.STUDY
     
-    def test_failed_move_non_adjacent(self):
+    def test_failed_move_non_adjacent(self, setup_players):
         """Should fail for unreachable room without enough moves."""
-        game = reset_game_state()
-        game.setup_game(["TestPlayer", "Other"])
-        player = game.get_player_by_name("TestPlayer")
+        game, player, _ = setup_players
         player.current_room = Room.KITCHEN
         player.in_hallway = False
         # Set a small number of moves (not enough to reach Library)
         player.moves_remaining = 1
         
-        result = move_to_room.func(player_name="TestPlayer", room_name="Library")
+        result = _move_to_room(player_name="TestPlayer", room_name="Library")
         
         # Should fail - Library is not reachable from Kitchen with only 1 move
         # (Kitchen has secret passage to Study, not Library)
-        assert "Cannot" in result or "❌" in result or "not reachable" in result.lower() or "No path" in result
+        assert _MOVE_REFUSED.search(result)
+        # The refusal comes before leaving, so the player is still in the room
+        assert player.current_room == Room.KITCHEN
+        assert player.moves_remaining == 1
     
-    def test_invalid_room_name(self):
+    def test_invalid_room_name(self, fresh_game):
         """Should error for invalid room name."""
-        game = reset_game_state()
-        game.setup_game(["TestPlayer", "Other"])
+        game = fresh_game(["TestPlayer", "Other"])
         
-        result = move_to_room.func(player_name="TestPlayer", room_name="InvalidRoom")
+        result = _move_to_room(player_name="TestPlayer", room_name="InvalidRoom")
         
         assert "Error" in result or "Invalid" in result
 
@@ -290,83 +331,40 @@ class TestMoveToRoom:
 class TestMakeSuggestion:
     """Test the Make Suggestion tool."""
     
-    def test_successful_suggestion(self):
+    def test_successful_suggestion(self, player_in_library):
         """Should make a suggestion in current room."""
-        game = reset_game_state()
-        game.setup_game(["TestPlayer", "Other"])
-        player = game.get_player_by_name("TestPlayer")
-        player.current_room = Room.LIBRARY
-        player.in_hallway = False
-        player.entered_room_this_turn = True
-        
-        result = make_suggestion.func(player_name="TestPlayer", suspect="Miss Scarlet", weapon="Knife")
-        
-        assert "SUGGESTION" in result
-        assert "Miss Scarlet" in result
-        assert "Knife" in result
-        assert "Library" in result
-    
-    def test_suggestion_not_in_room(self):
-        """Should fail if player not in a room."""
-        game = reset_game_state()
-        game.setup_game(["TestPlayer", "Other"])
-        player = game.get_player_by_name("TestPlayer")
-        player.current_room = None
-        
-        result = make_suggestion.func(player_name="TestPlayer", suspect="Miss Scarlet", weapon="Knife")
-        
-        assert "Error" in result
-    
-    def test_suggestion_not_entered_room_this_turn(self):
-        """Should fail if player didn't enter room this turn."""
-        game = reset_game_state()
-        game.setup_game(["TestPlayer", "Other"])
-        player = game.get_player_by_name("TestPlayer")
-        player.current_room = Room.LIBRARY
-        player.in_hallway = False
-        player.entered_room_this_turn = False  # Player was already in room
-        
-        result = make_suggestion.func(player_name="TestPlayer", suspect="Miss Scarlet", weapon="Knife")
+        result = _make_suggestion(player_name="TestPlayer", suspect="Miss Scarlet", weapon="Knife")
+        
+        assert_contains_all(result, "SUGGESTION", "Miss Scarlet", "Knife", "Library")
+    
+    @pytest.mark.parametrize(
+        "room,entered,suspect,weapon,hints",
+        [
+            # Not in a room
+            (None, False, "Miss Scarlet", "Knife", ()),
+            # Already in the room rather than entering it this turn
+            (Room.LIBRARY, False, "Miss Scarlet", "Knife", ("enter", "move")),
+            (Room.LIBRARY, True, "Invalid Person", "Knife", ()),
+            (Room.LIBRARY, True, "Miss Scarlet", "Invalid Weapon", ()),
+        ],
+        ids=["not_in_room", "not_entered_room_this_turn", "invalid_suspect", "invalid_weapon"],
+    )
+    def test_suggestion_error_paths(self, setup_players, room, entered, suspect, weapon, hints):
+        """Should refuse suggestions from outside a room, without entering it, or with bad names."""
+        game, player, _ = setup_players
+        player.current_room = room
+        player.in_hallway = room is None
+        player.entered_room_this_turn = entered
+        
+        result = _make_suggestion(player_name="TestPlayer", suspect=suspect, weapon=weapon)
         
         assert "Error" in result
-        assert "enter" in result.lower() or "move" in result.lower()
+        if hints:
+            assert any(hint in result.lower() for hint in hints)
     
-    def test_invalid_suspect(self):
-        """Should error for invalid suspect name."""
-        game = reset_game_state()
-        game.setup_game(["TestPlayer", "Other"])
-        player = game.get_player_by_name("TestPlayer")
-        player.current_room = Room.LIBRARY
-        player.in_hallway = False
-        player.entered_room_this_turn = True
-        
-        result = make_suggestion.func(player_name="TestPlayer", suspect="Invalid Person", weapon="Knife")
-        
-        assert "Error" in result or "Invalid" in result
-    
-    def test_invalid_weapon(self):
-        """Should error for invalid weapon name."""
-        game = reset_game_state()
-        game.setup_game(["TestPlayer", "Other"])
-        player = game.get_player_by_name("TestPlayer")
-        player.current_room = Room.LIBRARY
-        player.in_hallway = False
-        player.entered_room_this_turn = True
-        
-        result = make_suggestion.func(player_name="TestPlayer", suspect="Miss Scarlet", weapon="Invalid Weapon")
-        
-        assert "Error" in result or "Invalid" in result
-    
-    def test_mentions_suspect_moved(self):
+    def test_mentions_suspect_moved(self, player_in_library):
         """Should mention that suspect was moved to room."""
-        game = reset_game_state()
-        game.setup_game(["TestPlayer", "Other"])
-        player = game.get_player_by_name("TestPlayer")
-        player.current_room = Room.LIBRARY
-        player.in_hallway = False
-        player.entered_room_this_turn = True
-        
-        result = make_suggestion.func(player_name="TestPlayer", suspect="Miss Scarlet", weapon="Knife")
+        result = _make_suggestion(player_name="TestPlayer", suspect="Miss Scarlet", weapon="Knife")
         
         assert "moved" in result.lower()
 
@@ -374,52 +372,65 @@ class TestMakeSuggestion:
 class TestMakeAccusation:
     """Test the Make Accusation tool."""
     
-    def test_correct_accusation(self):
+    def test_correct_accusation(self, fresh_game):
         """Should win with correct accusation."""
-        game = reset_game_state()
-        game.setup_game(["TestPlayer", "Other"])
+        game = fresh_game(["TestPlayer", "Other"])
         
         # Get the actual solution
-        suspect = game.solution["suspect"].name
-        weapon = game.solution["weapon"].name
-        room = game.solution["room"].name
+        suspect, weapon, room = (game.solution[k].name for k in ("suspect", "weapon", "room"))
         
-        result = make_accusation.func(player_name="TestPlayer", suspect=suspect, weapon=weapon, room=room)
+        result = _make_accusation(player_name="TestPlayer", suspect=suspect, weapon=weapon, room=room)
         
-        assert "CORRECT" in result or "WINS" in result or "🎉" in result
+        assert _ACCUSATION_WON.search(result)
     
-    def test_wrong_accusation(self):
+    def test_wrong_accusation(self, fresh_game):
         """Should eliminate player with wrong accusation."""
-        game = reset_game_state()
-        game.setup_game(["TestPlayer", "Other"])
+        game = fresh_game(["TestPlayer", "Other"])
         
-        result = make_accusation.func(player_name="TestPlayer", suspect="Miss Scarlet", weapon="Knife", room="Kitchen")
+        # Right suspect and room, but a weapon that is not in the envelope
+        suspect, weapon, room = (game.solution[k].name for k in ("suspect", "weapon", "room"))
+        wrong_weapon = next(w.value for w in Weapon if w.value != weapon)
         
-        # Unless we got lucky with the solution
-        if "CORRECT" not in result:
-            assert "WRONG" in result or "eliminated" in result.lower() or "❌" in result
+        result = _make_accusation(player_name="TestPlayer", suspect=suspect, weapon=wrong_weapon, room=room)
+        
+        assert _ACCUSATION_LOST.search(result)
     
-    def test_eliminated_player_cannot_accuse(self):
+    def test_eliminated_player_cannot_accuse(self, setup_players):
         """Eliminated player should not be able to accuse."""
-        game = reset_game_state()
-        game.setup_game(["TestPlayer", "Other"])
-        player = game.get_player_by_name("TestPlayer")
+        game, player, _ = setup_players
         player.is_active = False
         
-        result = make_accusation.func(player_name="TestPlayer", suspect="Miss Scarlet", weapon="Knife", room="Kitchen")
+        result = _make_accusation(player_name="TestPlayer", suspect="Miss Scarlet", weapon="Knife", room="Kitchen")
         
         assert "eliminated" in result.lower() or "Error" in result
+    
+    @pytest.mark.parametrize(
+        "suspect,weapon,room",
+        [
+            ("Invalid Person", "Knife", "Kitchen"),
+            ("Miss Scarlet", "Invalid Weapon", "Kitchen"),
+            ("Miss Scarlet", "Knife", "Invalid Room"),
+        ],
+        ids=["invalid_suspect", "invalid_weapon", "invalid_room"],
+    )
+    def test_invalid_names(self, setup_players, suspect, weapon, room):
+        """Should reject unknown card names without eliminating the player."""
+        game, player, _ = setup_players
+        
+        result = _make_accusation(player_name="TestPlayer", suspect=suspect, weapon=weapon, room=room)
+        
+        assert "Error" in result
+        assert player.is_active
 
 
 class TestGetGameStatus:
     """Test the Get Game Status tool."""
     
-    def test_shows_turn_info(self):
+    def test_shows_turn_info(self, fresh_game):
         """Should show current turn information."""
-        game = reset_game_state()
-        game.setup_game(["P1", "P2"])
+        game = fresh_game(["P1", "P2"])
         
-        result = get_game_status.func()
+        result = _get_game_status()
         
         assert "Turn" in result
         assert "P1" in result or "P2" in result
@@ -432,64 +443,63 @@ class TestGetSuggestionHistory:
         """Should indicate no suggestions yet."""
         reset_game_state()
         
-        result = get_suggestion_history.func()
+        result = _get_suggestion_history()
         
         assert "No suggestions" in result or len(result) > 0
     
-    def test_shows_suggestions(self):
+    def test_shows_suggestions(self, fresh_game):
         """Should show made suggestions."""
-        game = reset_game_state()
-        game.setup_game(["P1", "P2"])
+        game = fresh_game(["P1", "P2"])
         player = game.get_player_by_name("P1")
         player.current_room = Room.LIBRARY
         player.in_hallway = False
         player.entered_room_this_turn = True
         
         # Make a suggestion
-        make_suggestion.func(player_name="P1", suspect="Miss Scarlet", weapon="Knife")
+        _make_suggestion(player_name="P1", suspect="Miss Scarlet", weapon="Knife")
         
-        result = get_suggestion_history.func()
+        result = _get_suggestion_history()
         
-        assert "Miss Scarlet" in result
-        assert "Knife" in result
+        assert_contains_all(result, "Miss Scarlet", "Knife")
 
 
 class TestGetMyKnowledge:
     """Test the Get My Knowledge tool."""
     
-    def test_shows_hand(self):
+    def test_shows_hand(self, fresh_game):
         """Should show cards in player's hand."""
-        game = reset_game_state()
-        game.setup_game(["TestPlayer", "Other"])
+        game = fresh_game(["TestPlayer", "Other"])
         
-        result = get_my_knowledge.func(player_name="TestPlayer")
+        result = _get_my_knowledge(player_name="TestPlayer")
         
         assert "Knowledge" in result or "hand" in result.lower()
+    
+    def test_seen_cards_listed_once_and_eliminated(self, setup_players):
+        """Cards shown by others should be listed once and bracketed as eliminated."""
+        game, player, _ = setup_players
+        shown = game.get_player_by_name("Other").cards[0].name
+        
+        player.knowledge["seen_cards"].add(shown)
+        player.knowledge["seen_cards"].add(shown)
+        result = _get_my_knowledge(player_name="TestPlayer")
+        
+        assert result.count(f"  - {shown}\n") == 1
+        assert f"[{shown}]" in result
 
 
 class TestGetValidOptions:
     """Test the Get Valid Options tool."""
     
-    def test_lists_all_suspects(self):
-        """Should list all suspect names."""
-        result = get_valid_options.func()
-        
-        assert "Miss Scarlet" in result
-        assert "Colonel Mustard" in result
-        assert "Professor Plum" in result
-    
-    def test_lists_all_weapons(self):
-        """Should list all weapon names."""
-        result = get_valid_options.func()
-        
-        assert "Knife" in result
-        assert "Candlestick" in result
-        assert "Rope" in result
-    
-    def test_lists_all_rooms(self):
-        """Should list all room names."""
-        result = get_valid_options.func()
-        
-        assert "Kitchen" in result
-        assert "Library" in result
-        assert "Ballroom" in result
+    def test_lists_all_options(self):
+        """Should list exactly the suspect, weapon and room names, by category."""
+        listed = {}
+        for line in _get_valid_options().splitlines():
+            heading, sep, names = line.partition(": ")
+            if sep:
+                listed[heading] = set(names.split(", "))
+        
+        assert listed == {
+            "SUSPECTS": {s.value for s in Suspect},
+            "WEAPONS": {w.value for w in Weapon},
+            "ROOMS": {r.value for r in Room},
+        }
@@ -4,18 +4,44 @@ Tests retry logic and game execution helpers.
 """
 
 import pytest
-import time
-from unittest.mock import Mock, patch, MagicMock
-import sys
-import os
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# CREWAI_TRACING_ENABLED is switched off in conftest.py, before crewai is imported
+from clue_game.main import retry_with_backoff, get_error_details
 
-# Set environment variable before importing
-os.environ["CREWAI_TRACING_ENABLED"] = "false"
 
-from clue_game.main import retry_with_backoff, get_error_details
+def sequence_func(*outcomes):
+    """
+    Stand-in for a crew call: each call returns the next outcome, or raises
+    it if it is an exception. Calls are counted in .call_count, as on a Mock.
+    """
+    remaining = iter(outcomes)
+    
+    def call():
+        call.call_count += 1
+        outcome = next(remaining)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+    
+    call.call_count = 0
+    return call
+
+
+@pytest.fixture
+def mock_response_factory():
+    """Build a stand-in HTTP response with the attributes get_error_details reads."""
+    def make(status_code, text, candidates=None):
+        # candidates=None keeps the Gemini-specific handling out of the way
+        return SimpleNamespace(status_code=status_code, text=text, candidates=candidates)
+    return make
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Make retry backoff delays instant."""
+    monkeypatch.setattr("clue_game.main.time.sleep", lambda *_: None)
 
 
 class TestGetErrorDetails:
@@ -42,62 +68,45 @@ class TestGetErrorDetails:
         assert "Type: ValueError" in details
         assert "Caused by: ConnectionError" in details
     
-    def test_exception_with_status_code(self):
-        """Should include status code when present."""
+    @pytest.mark.parametrize(
+        "attr,value,expected",
+        [
+            ("status_code", 429, ("Status Code: 429",)),
+            ("code", "RATE_LIMIT_EXCEEDED", ("Error Code: RATE_LIMIT_EXCEEDED",)),
+            ("error", {"message": "Quota exceeded", "retry_after": 60}, ("Error Details:", "Quota exceeded")),
+        ],
+        ids=["status_code", "error_code", "error_details"],
+    )
+    def test_exception_attribute(self, attr, value, expected):
+        """Should include API error attributes (status code, error code, details) when present."""
         exc = Exception("API error")
-        exc.status_code = 429
+        setattr(exc, attr, value)
         details = get_error_details(exc)
         
-        assert "Status Code: 429" in details
+        for text in expected:
+            assert text in details
     
-    def test_exception_with_response(self):
+    def test_exception_with_response(self, mock_response_factory):
         """Should include response details when present."""
-        mock_response = Mock()
-        mock_response.status_code = 503
-        mock_response.text = "Service Unavailable"
-        # Ensure candidates is not iterable to avoid Gemini-specific handling
-        mock_response.candidates = None
-        
         exc = Exception("API error")
-        exc.response = mock_response
+        exc.response = mock_response_factory(503, "Service Unavailable")
         details = get_error_details(exc)
         
         assert "Response Status: 503" in details
         assert "Response Body: Service Unavailable" in details
     
-    def test_exception_with_error_code(self):
-        """Should include error code when present."""
-        exc = Exception("API error")
-        exc.code = "RATE_LIMIT_EXCEEDED"
-        details = get_error_details(exc)
-        
-        assert "Error Code: RATE_LIMIT_EXCEEDED" in details
-    
-    def test_exception_with_error_details(self):
-        """Should include error details attribute when present."""
-        exc = Exception("API error")
-        exc.error = {"message": "Quota exceeded", "retry_after": 60}
-        details = get_error_details(exc)
-        
-        assert "Error Details:" in details
-        assert "Quota exceeded" in details
-    
-    def test_long_response_text_truncated(self):
+    def test_long_response_text_truncated(self, mock_response_factory):
         """Should truncate long response text."""
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_response.text = "A" * 1000  # Very long text
-        # Ensure candidates is not iterable to avoid Gemini-specific handling
-        mock_response.candidates = None
-        
         exc = Exception("API error")
-        exc.response = mock_response
+        exc.response = mock_response_factory(500, "A" * 600)  # Just over the limit
         details = get_error_details(exc)
         
         # Should be truncated to 500 chars
-        assert len(details) < 1000
+        assert f"Response Body: {'A' * 500}" in details
+        assert "A" * 501 not in details
 
 
+@pytest.mark.usefixtures("no_sleep")
 class TestRetryWithBackoff:
     """Test the retry_with_backoff function."""
     
@@ -112,7 +121,7 @@ class TestRetryWithBackoff:
     
     def test_success_on_second_attempt(self):
         """Should retry and succeed on second attempt."""
-        mock_func = Mock(side_effect=[Exception("First fail"), "success"])
+        mock_func = sequence_func(Exception("First fail"), "success")
         
         result = retry_with_backoff(mock_func, max_retries=3, base_delay=0.01)
         
@@ -121,11 +130,11 @@ class TestRetryWithBackoff:
     
     def test_success_on_third_attempt(self):
         """Should retry and succeed on third attempt."""
-        mock_func = Mock(side_effect=[
+        mock_func = sequence_func(
             Exception("First fail"),
             Exception("Second fail"),
             "success"
-        ])
+        )
         
         result = retry_with_backoff(mock_func, max_retries=3, base_delay=0.01)
         
@@ -144,7 +153,7 @@ class TestRetryWithBackoff:
     
     def test_none_response_triggers_retry(self):
         """Should retry if function returns None."""
-        mock_func = Mock(side_effect=[None, "success"])
+        mock_func = sequence_func(None, "success")
         
         result = retry_with_backoff(mock_func, max_retries=3, base_delay=0.01)
         
@@ -153,13 +162,10 @@ class TestRetryWithBackoff:
     
     def test_empty_raw_response_triggers_retry(self):
         """Should retry if response has empty raw attribute."""
-        empty_response = Mock()
-        empty_response.raw = ""
+        empty_response = SimpleNamespace(raw="")
+        valid_response = SimpleNamespace(raw="valid content")
         
-        valid_response = Mock()
-        valid_response.raw = "valid content"
-        
-        mock_func = Mock(side_effect=[empty_response, valid_response])
+        mock_func = sequence_func(empty_response, valid_response)
         
         result = retry_with_backoff(mock_func, max_retries=3, base_delay=0.01)
         
@@ -167,23 +173,35 @@ class TestRetryWithBackoff:
         assert mock_func.call_count == 2
     
     def test_exponential_backoff_timing(self):
-        """Should use exponential backoff between retries."""
-        mock_func = Mock(side_effect=[
+        """Should use jittered exponential backoff between retries."""
+        mock_func = sequence_func(
             Exception("Fail 1"),
             Exception("Fail 2"),
             "success"
-        ])
+        )
         
-        start_time = time.time()
         with patch('clue_game.main.time.sleep') as mock_sleep:
             result = retry_with_backoff(mock_func, max_retries=3, base_delay=5)
         
         # Should have called sleep twice (after 1st and 2nd failures)
         assert mock_sleep.call_count == 2
-        # First retry: base_delay * 2^0 = 5
-        # Second retry: base_delay * 2^1 = 10
-        mock_sleep.assert_any_call(5)
-        mock_sleep.assert_any_call(10)
+        first_delay = mock_sleep.call_args_list[0].args[0]
+        second_delay = mock_sleep.call_args_list[1].args[0]
+        # First retry: between base_delay and base_delay * 3 * 2^0 = 15
+        # Second retry: between base_delay and base_delay * 3 * 2^1 = 30
+        assert 5 <= first_delay <= 15
+        assert 5 <= second_delay <= 30
+    
+    def test_backoff_respects_max_delay(self):
+        """Should never sleep longer than max_delay."""
+        mock_func = sequence_func(*[Exception("Fail")] * 4, "success")
+        
+        with patch('clue_game.main.time.sleep') as mock_sleep:
+            retry_with_backoff(mock_func, max_retries=4, base_delay=5, max_delay=12)
+        
+        assert mock_sleep.call_count == 4
+        for call in mock_sleep.call_args_list:
+            assert 5 <= call.args[0] <= 12
     
     def test_zero_retries(self):
         """Should not retry when max_retries is 0."""
@@ -206,8 +224,7 @@ class TestRetryWithBackoff:
     
     def test_response_with_valid_raw_attribute(self):
         """Should accept response with non-empty raw attribute."""
-        valid_response = Mock()
-        valid_response.raw = "Some valid content"
+        valid_response = SimpleNamespace(raw="Some valid content")
         
         mock_func = Mock(return_value=valid_response)
         
@@ -227,16 +244,17 @@ class TestRetryWithBackoff:
         assert mock_func.call_count == 1
 
 
+@pytest.mark.usefixtures("no_sleep")
 class TestRetryIntegration:
     """Integration tests for retry behavior with mocked crews."""
     
     def test_retry_handles_llm_empty_response_error(self):
         """Should handle the specific LLM empty response error."""
         # Simulate the actual error pattern from CrewAI
-        mock_func = Mock(side_effect=[
+        mock_func = sequence_func(
             ValueError("Invalid response from LLM call - None or empty"),
             "success"
-        ])
+        )
         
         result = retry_with_backoff(mock_func, max_retries=3, base_delay=0.01)
         
@@ -245,11 +263,11 @@ class TestRetryIntegration:
     
     def test_retry_with_mixed_failures(self):
         """Should handle different types of failures."""
-        mock_func = Mock(side_effect=[
+        mock_func = sequence_func(
             ConnectionError("Network error"),
             TimeoutError("Timeout"),
             "success"
-        ])
+        )
         
         result = retry_with_backoff(mock_func, max_retries=3, base_delay=0.01)
         
@@ -8,9 +8,11 @@ from clue_game.notebook import (
     DetectiveNotebook,
     CardStatus,
     get_notebook,
+    find_notebook,
     reset_notebook,
     reset_all_notebooks,
     update_all_notebooks_card_shown,
+    update_all_notebooks_cards_shown,
 )
 from clue_game.game_state import Room, Suspect, Weapon
 
@@ -63,12 +65,49 @@ class TestMarkingCards:
         assert notebook.entries["Miss Scarlet"].player_status["P3"] == CardStatus.NOT_HAS
         assert notebook.entries["Miss Scarlet"].envelope_status == CardStatus.NOT_HAS
     
+    def test_owner_tracks_marks_and_deductions(self):
+        """get_owner should follow marks and envelope deductions."""
+        notebook = DetectiveNotebook("Test", ["P1", "P2"])
+        assert notebook.entries["Knife"].get_owner() is None
+        
+        notebook.mark_card("Knife", "P2")
+        notebook.mark_not_has("Rope", "P1")
+        notebook.mark_not_has("Rope", "P2")
+        
+        assert notebook.entries["Knife"].get_owner() == "P2"
+        assert notebook.entries["Rope"].get_owner() == "ENVELOPE"
+        assert notebook.entries["Rope"].is_solved()
+    
+    def test_mark_envelope_has_card(self):
+        """Marking the envelope (any case) clears every player."""
+        notebook = DetectiveNotebook("Test", ["P1", "P2"])
+        notebook.mark_card("Knife", "envelope")
+        
+        entry = notebook.entries["Knife"]
+        assert entry.envelope_status == CardStatus.HAS
+        assert entry.player_status["P1"] == CardStatus.NOT_HAS
+        assert entry.player_status["P2"] == CardStatus.NOT_HAS
+    
     def test_mark_not_has(self):
         """Should mark a player as NOT having a card."""
         notebook = DetectiveNotebook("Test", ["P1", "P2"])
         notebook.mark_not_has("Miss Scarlet", "P1")
         
         assert notebook.entries["Miss Scarlet"].player_status["P1"] == CardStatus.NOT_HAS
+    
+    def test_mark_not_has_overrides_has(self):
+        """A NOT_HAS written over a HAS should forget the owner again."""
+        notebook = DetectiveNotebook("Test", ["P1", "P2"])
+        notebook.mark_card("Knife", "P2")
+        notebook.mark_not_has("Knife", "P2")
+        
+        entry = notebook.entries["Knife"]
+        assert entry.get_owner() is None
+        assert not entry.is_solved()
+        assert "Knife" in notebook.get_unknown_cards()
+        
+        validation = notebook.validate_accusation("Miss Scarlet", "Knife", "Kitchen")
+        assert not any("held by" in w for w in validation["warnings"])
 
 
 class TestRecordingMyCards:
@@ -111,6 +150,18 @@ class TestDeduction:
         
         # Should be a string
         assert isinstance(possible, str)
+    
+    def test_summaries_refresh_after_marking(self):
+        """Cached summaries should reflect marks made after the first query."""
+        notebook = DetectiveNotebook("Test", ["Test", "P2"])
+        
+        assert "Knife" in notebook.get_unknown_cards()
+        assert notebook.get_unknown_cards() is notebook.get_unknown_cards()
+        
+        notebook.mark_card("Knife", "P2")
+        
+        assert "Knife" not in notebook.get_unknown_cards()
+        assert "Knife" not in notebook.get_possible_solution()
 
 
 class TestStrategicSuggestions:
@@ -169,6 +220,15 @@ class TestGlobalNotebookManagement:
         # Getting notebooks again should give fresh ones
         new_nb1 = get_notebook("P1", ["P1", "P2"])
         assert new_nb1.entries["Miss Scarlet"].player_status["P1"] == CardStatus.UNKNOWN
+    
+    def test_find_notebook_returns_existing_or_none(self):
+        """find_notebook should return the existing notebook and never create one."""
+        reset_all_notebooks()
+        assert find_notebook("Test") is None
+        assert find_notebook("Test") is None
+        
+        nb = get_notebook("Test", ["Test", "P2"])
+        assert find_notebook("Test") is nb
 
 
 class TestNotebookOutput:
@@ -183,6 +243,16 @@ class TestNotebookOutput:
         
         assert "Miss Scarlet" in grid_str
         assert "✓" in grid_str
+    
+    def test_quiet_notebook_skips_event_log(self):
+        """verbose=False should still deduce but leave the event log empty."""
+        notebook = DetectiveNotebook("Test", ["P1", "P2"], verbose=False)
+        notebook.mark_not_has("Knife", "P1")
+        notebook.mark_not_has("Knife", "P2")
+        
+        assert notebook.entries["Knife"].envelope_status == CardStatus.HAS
+        assert notebook.turn_log == []
+        assert notebook.get_turn_log() == "No events logged yet."
 
 
 class TestAutoDeduction:
@@ -198,6 +268,20 @@ class TestAutoDeduction:
         
         # Should auto-deduce ENVELOPE has it (after _check_deductions runs)
         assert notebook.entries["Miss Scarlet"].envelope_status == CardStatus.HAS
+    
+    def test_auto_deduce_envelope_from_passes(self):
+        """Passes recorded with a suggestion should feed the envelope deduction."""
+        notebook = DetectiveNotebook("P1", ["P1", "P2", "P3"])
+        notebook.mark_not_has("Knife", "P1")
+        
+        notebook.record_suggestion(
+            turn_number=1, suggester="P1",
+            suspect="Mr. Green", weapon="Knife", room="Hall",
+            players_who_passed=["P2", "P3"],
+        )
+        
+        assert notebook.entries["Knife"].envelope_status == CardStatus.HAS
+        assert notebook.entries["Mr. Green"].envelope_status == CardStatus.UNKNOWN
 
 
 class TestAccusationValidation:
@@ -227,6 +311,18 @@ class TestAccusationValidation:
         assert result["valid"] == True
         assert len(result["warnings"]) == 0
     
+    def test_validate_accusation_recommendation_is_a_copy(self):
+        """Editing the embedded recommendation must not change later results."""
+        notebook = DetectiveNotebook("Test", ["Test", "P2"])
+        
+        result = notebook.validate_accusation("Miss Scarlet", "Knife", "Kitchen")
+        result["recommendation"]["can_accuse"] = True
+        result["recommendation"]["possible_rooms"].clear()
+        
+        rec = notebook.validate_accusation("Miss Scarlet", "Knife", "Kitchen")["recommendation"]
+        assert rec["can_accuse"] == False
+        assert len(rec["possible_rooms"]) == 9
+    
     def test_get_accusation_recommendation_not_ready(self):
         """Should not recommend accusation when too many possibilities."""
         notebook = DetectiveNotebook("Test", ["Test", "P2"])
@@ -237,6 +333,23 @@ class TestAccusationValidation:
         assert rec["can_accuse"] == False
         assert rec["suspect"] is None
     
+    def test_accusation_recommendation_lists_are_copies(self):
+        """Mutating the recommendation must not leak into later notebook queries."""
+        notebook = DetectiveNotebook("Test", ["Test", "P2"])
+        notebook.mark_card("Knife", "P2")
+        
+        rec = notebook.get_accusation_recommendation()
+        rec["possible_suspects"].clear()
+        rec["can_accuse"] = True
+        
+        again = notebook.get_accusation_recommendation()
+        assert len(again["possible_suspects"]) == 6
+        assert again["can_accuse"] == False
+        
+        result = notebook.validate_suggestion("Miss Scarlet", "Knife", "Kitchen")
+        assert len(result["better_suspects"]) == 6
+        assert "Miss Scarlet" in notebook.get_possible_solution()
+    
     def test_get_accusation_recommendation_ready(self):
         """Should recommend accusation when one option in each category."""
         notebook = DetectiveNotebook("Test", ["Test", "P2"])
@@ -306,6 +419,34 @@ class TestSuggestionValidation:
         assert "Miss Scarlet" not in result["better_suspects"]
         assert len(result["better_weapons"]) > 0
         assert "Knife" not in result["better_weapons"]
+    
+    def test_validate_suggestion_refreshes_after_update(self):
+        """A repeated suggestion should reflect cards marked in between."""
+        notebook = DetectiveNotebook("Test", ["Test", "P2"])
+        
+        assert notebook.validate_suggestion("Miss Scarlet", "Knife", "Kitchen")["valid"] == True
+        notebook.mark_card("Knife", "P2")
+        
+        result = notebook.validate_suggestion("Miss Scarlet", "Knife", "Kitchen")
+        assert result["valid"] == False
+        assert result["wasted_cards"] == ["Knife"]
+    
+    def test_validate_suggestion_result_is_a_copy(self):
+        """Editing a returned verdict must not change the next identical call."""
+        notebook = DetectiveNotebook("Test", ["Test", "P2"])
+        notebook.mark_card("Knife", "P2")
+        
+        result = notebook.validate_suggestion("Miss Scarlet", "Knife", "Kitchen")
+        result["valid"] = True
+        result["warnings"].append("x")
+        result["wasted_cards"].clear()
+        result["better_weapons"].clear()
+        
+        again = notebook.validate_suggestion("Miss Scarlet", "Knife", "Kitchen")
+        assert again["valid"] == False
+        assert "x" not in again["warnings"]
+        assert again["wasted_cards"] == ["Knife"]
+        assert len(again["better_weapons"]) == 5
 
 
 class TestUpdateAllNotebooksCardShown:
@@ -417,3 +558,17 @@ class TestUpdateAllNotebooksCardShown:
             assert nb.entries["Knife"].player_status["Colonel Mustard"] == CardStatus.HAS
             assert nb.entries["Library"].player_status["Mrs. White"] == CardStatus.HAS
             assert nb.entries["Miss Scarlet"].player_status["Miss Scarlet"] == CardStatus.HAS
+    
+    def test_batch_update_applies_every_pair(self):
+        """update_all_notebooks_cards_shown should apply each reveal to every notebook."""
+        reset_all_notebooks()
+        players = ["Miss Scarlet", "Colonel Mustard", "Mrs. White"]
+        for player in players:
+            get_notebook(player, players)
+        
+        update_all_notebooks_cards_shown([("Knife", "Colonel Mustard"), ("Library", "Mrs. White")])
+        
+        for player in players:
+            nb = get_notebook(player, players)
+            assert nb.entries["Knife"].get_owner() == "Colonel Mustard"
+            assert nb.entries["Library"].get_owner() == "Mrs. White"
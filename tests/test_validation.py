@@ -21,13 +21,19 @@ from clue_game.tools.validation_tools import (
 )
 
 
+def grade_in_report(report, player_name):
+    """The grade shown in a player's section of the game quality report."""
+    section = report[report.index(f"{player_name}:\n"):]
+    start = section.index("Grade: ") + len("Grade: ")
+    return section[start:section.index("\n", start)]
+
+
 class TestValidationTracking:
     """Test validation tracking in game state."""
     
-    def test_player_has_validation_fields(self):
+    def test_player_has_validation_fields(self, fresh_game):
         """Players should have validation tracking fields."""
-        game = reset_game_state()
-        game.setup_game(["Player1", "Player2"])
+        game = fresh_game(["Player1", "Player2"])
         player = game.get_player_by_name("Player1")
         
         assert hasattr(player, "invalid_move_attempts")
@@ -39,10 +45,9 @@ class TestValidationTracking:
         assert player.successful_suggestions == 0
         assert player.wasted_suggestions == 0
     
-    def test_game_state_has_validation_log(self):
+    def test_game_state_has_validation_log(self, fresh_game):
         """Game state should have system-wide validation log."""
-        game = reset_game_state()
-        game.setup_game(["Player1", "Player2"])
+        game = fresh_game(["Player1", "Player2"])
         
         assert hasattr(game, "validation_log")
         assert isinstance(game.validation_log, list)
@@ -52,10 +57,9 @@ class TestValidationTracking:
 class TestLogValidationWarning:
     """Test logging validation warnings."""
     
-    def test_log_warning_creates_entry(self):
+    def test_log_warning_creates_entry(self, fresh_game):
         """Should create a validation warning entry."""
-        game = reset_game_state()
-        game.setup_game(["Player1", "Player2"])
+        game = fresh_game(["Player1", "Player2"])
         
         result = log_validation_warning.func(
             player_name="Player1",
@@ -72,10 +76,9 @@ class TestLogValidationWarning:
         assert player.validation_warnings[0]["type"] == "invalid_move"
         assert player.validation_warnings[0]["severity"] == "warning"
     
-    def test_log_error_increments_invalid_attempts(self):
+    def test_log_error_increments_invalid_attempts(self, fresh_game):
         """Error severity should increment invalid move counter."""
-        game = reset_game_state()
-        game.setup_game(["Player1", "Player2"])
+        game = fresh_game(["Player1", "Player2"])
         
         log_validation_warning.func(
             player_name="Player1",
@@ -87,10 +90,9 @@ class TestLogValidationWarning:
         player = game.get_player_by_name("Player1")
         assert player.invalid_move_attempts == 1
     
-    def test_log_warning_does_not_increment_invalid_attempts(self):
+    def test_log_warning_does_not_increment_invalid_attempts(self, fresh_game):
         """Warning severity should not increment invalid move counter."""
-        game = reset_game_state()
-        game.setup_game(["Player1", "Player2"])
+        game = fresh_game(["Player1", "Player2"])
         
         log_validation_warning.func(
             player_name="Player1",
@@ -102,10 +104,9 @@ class TestLogValidationWarning:
         player = game.get_player_by_name("Player1")
         assert player.invalid_move_attempts == 0
     
-    def test_validation_added_to_global_log(self):
+    def test_validation_added_to_global_log(self, fresh_game):
         """Validation should be added to game-wide log."""
-        game = reset_game_state()
-        game.setup_game(["Player1", "Player2"])
+        game = fresh_game(["Player1", "Player2"])
         
         log_validation_warning.func(
             player_name="Player1",
@@ -122,10 +123,9 @@ class TestLogValidationWarning:
 class TestTrackSuggestionQuality:
     """Test tracking suggestion quality."""
     
-    def test_track_logical_suggestion(self):
+    def test_track_logical_suggestion(self, fresh_game):
         """Should increment successful suggestions counter."""
-        game = reset_game_state()
-        game.setup_game(["Player1", "Player2"])
+        game = fresh_game(["Player1", "Player2"])
         
         result = track_suggestion_quality.func(
             player_name="Player1",
@@ -138,10 +138,9 @@ class TestTrackSuggestionQuality:
         assert player.successful_suggestions == 1
         assert player.wasted_suggestions == 0
     
-    def test_track_wasted_suggestion(self):
+    def test_track_wasted_suggestion(self, fresh_game):
         """Should increment wasted suggestions counter."""
-        game = reset_game_state()
-        game.setup_game(["Player1", "Player2"])
+        game = fresh_game(["Player1", "Player2"])
         
         result = track_suggestion_quality.func(
             player_name="Player1",
@@ -156,10 +155,9 @@ class TestTrackSuggestionQuality:
         assert player.successful_suggestions == 0
         assert player.wasted_suggestions == 1
     
-    def test_track_multiple_suggestions(self):
+    def test_track_multiple_suggestions(self, fresh_game):
         """Should track multiple suggestions and calculate quality percentage."""
-        game = reset_game_state()
-        game.setup_game(["Player1", "Player2"])
+        game = fresh_game(["Player1", "Player2"])
         
         # Track 3 logical and 1 wasted
         track_suggestion_quality.func(player_name="Player1", is_wasted=False)
@@ -177,10 +175,9 @@ class TestTrackSuggestionQuality:
 class TestGetPlayerPerformanceMetrics:
     """Test getting player performance metrics."""
     
-    def test_get_single_player_metrics(self):
+    def test_get_single_player_metrics(self, fresh_game):
         """Should return metrics for a specific player."""
-        game = reset_game_state()
-        game.setup_game(["Player1", "Player2"])
+        game = fresh_game(["Player1", "Player2"])
         
         # Add some data
         player = game.get_player_by_name("Player1")
@@ -194,10 +191,9 @@ class TestGetPlayerPerformanceMetrics:
         assert "5" in result or "71" in result  # 5/7 = 71%
         assert "Logical suggestions" in result or "suggestions" in result.lower()
     
-    def test_get_all_players_metrics(self):
+    def test_get_all_players_metrics(self, fresh_game):
         """Should return metrics for all players when no name specified."""
-        game = reset_game_state()
-        game.setup_game(["Player1", "Player2", "Player3"])
+        game = fresh_game(["Player1", "Player2", "Player3"])
         
         result = get_player_performance_metrics.func()
         
@@ -206,10 +202,9 @@ class TestGetPlayerPerformanceMetrics:
         assert "Player3" in result
         assert "PERFORMANCE METRICS" in result or "performance" in result.lower()
     
-    def test_shows_recent_warnings(self):
+    def test_shows_recent_warnings(self, fresh_game):
         """Should display recent validation warnings."""
-        game = reset_game_state()
-        game.setup_game(["Player1", "Player2"])
+        game = fresh_game(["Player1", "Player2"])
         
         log_validation_warning.func(
             player_name="Player1",
@@ -234,10 +229,9 @@ class TestGetValidationLog:
         
         assert "No validation events" in result or "not" in result.lower()
     
-    def test_shows_recent_events(self):
+    def test_shows_recent_events(self, fresh_game):
         """Should show recent validation events."""
-        game = reset_game_state()
-        game.setup_game(["Player1", "Player2"])
+        game = fresh_game(["Player1", "Player2"])
         
         # Log multiple events
         for i in range(5):
@@ -259,10 +253,9 @@ class TestGetValidationLog:
 class TestGetGameQualityReport:
     """Test game quality report generation."""
     
-    def test_generates_comprehensive_report(self):
+    def test_generates_comprehensive_report(self, fresh_game):
         """Should generate full quality report."""
-        game = reset_game_state()
-        game.setup_game(["Player1", "Player2", "Player3"])
+        game = fresh_game(["Player1", "Player2", "Player3"])
         
         # Add varied performance data
         p1 = game.get_player_by_name("Player1")
@@ -283,10 +276,9 @@ class TestGetGameQualityReport:
         assert "Player3" in result
         assert "OVERALL" in result or "Overall" in result
     
-    def test_calculates_grades(self):
+    def test_calculates_grades(self, fresh_game):
         """Should assign performance grades to players."""
-        game = reset_game_state()
-        game.setup_game(["ExcellentPlayer", "GoodPlayer", "PoorPlayer"])
+        game = fresh_game(["ExcellentPlayer", "GoodPlayer", "PoorPlayer"])
         
         # Excellent: 80%+ logical, 0 invalid
         excellent = game.get_player_by_name("ExcellentPlayer")
@@ -310,13 +302,15 @@ class TestGetGameQualityReport:
         
         # Check for grades (A, B, C, D or Excellent, Good, etc.)
         assert "Grade" in result or "grade" in result
-        # Excellent player should have better grade than poor player
-        assert result.index("ExcellentPlayer") < result.index("PoorPlayer")
+        # Each player gets the grade for their own record (the report lists
+        # players in turn order, which depends on the dealt characters)
+        assert grade_in_report(result, "ExcellentPlayer") == "A (Excellent)"
+        assert grade_in_report(result, "GoodPlayer") == "B (Good)"
+        assert grade_in_report(result, "PoorPlayer") == "D (Needs Improvement)"
     
-    def test_shows_overall_statistics(self):
+    def test_shows_overall_statistics(self, fresh_game):
         """Should show aggregate statistics."""
-        game = reset_game_state()
-        game.setup_game(["Player1", "Player2"])
+        game = fresh_game(["Player1", "Player2"])
         game.turn_number = 10
         
         p1 = game.get_player_by_name("Player1")
@@ -336,11 +330,10 @@ class TestGetGameQualityReport:
 class TestValidationIntegrationWithNotebook:
     """Test validation works with notebook validation."""
     
-    def test_wasted_suggestion_detected(self):
+    def test_wasted_suggestion_detected(self, fresh_game):
         """Should detect when suggestion uses known cards."""
-        game = reset_game_state()
         reset_all_notebooks()
-        game.setup_game(["Player1", "Player2"])
+        game = fresh_game(["Player1", "Player2"])
         
         # Setup notebook with known card
         from clue_game.notebook import get_notebook
@@ -353,11 +346,10 @@ class TestValidationIntegrationWithNotebook:
         assert len(validation["wasted_cards"]) > 0
         assert "Miss Scarlet" in validation["wasted_cards"]
     
-    def test_logical_suggestion_approved(self):
+    def test_logical_suggestion_approved(self, fresh_game):
         """Should approve suggestions using unknown cards."""
-        game = reset_game_state()
         reset_all_notebooks()
-        game.setup_game(["Player1", "Player2"])
+        game = fresh_game(["Player1", "Player2"])
         
         from clue_game.notebook import get_notebook
         notebook = get_notebook("Player1", ["Player1", "Player2"])
@@ -368,11 +360,10 @@ class TestValidationIntegrationWithNotebook:
         assert validation["valid"]
         assert len(validation["wasted_cards"]) == 0
     
-    def test_illogical_accusation_blocked(self):
+    def test_illogical_accusation_blocked(self, fresh_game):
         """Should block accusations that contradict notebook."""
-        game = reset_game_state()
         reset_all_notebooks()
-        game.setup_game(["Player1", "Player2"])
+        game = fresh_game(["Player1", "Player2"])
         
         from clue_game.notebook import get_notebook
         notebook = get_notebook("Player1", ["Player1", "Player2"])